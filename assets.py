@@ -0,0 +1,113 @@
+"""Local, content-addressed cache for the remote images used in slides.
+
+``python assets.py`` downloads every image referenced by the slide decks,
+resizes it to the widths the slides actually display (plus 2x for HiDPI
+screens) and stores the results under ``static/assets/`` with names derived
+from the image's SHA-256, alongside a ``manifest.json`` mapping source URLs to
+files. Commit the results so lectures work without network access.
+``python assets.py --check`` downloads nothing; it lists the deck images that
+are not vendored yet and exits non-zero if there are any.
+
+The app serves these files through Streamlit's static file serving. Because a
+file's name changes whenever its content does, a reverse proxy can mark
+``/app/static/assets/`` as ``Cache-Control: public, max-age=31536000, immutable``.
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import urllib.request
+from functools import lru_cache
+from pathlib import Path
+
+ASSET_DIR = Path(__file__).parent / "static" / "assets"
+MANIFEST_PATH = ASSET_DIR / "manifest.json"
+# URL prefix Streamlit serves the static/ folder under
+STATIC_URL = "app/static/assets"
+
+# Offline mode never touches the network: images that aren't vendored are skipped
+OFFLINE = os.environ.get("PIONEER_OFFLINE", "").lower() in ("1", "true", "yes")
+
+USER_AGENT = "his220-asset-vendor/1.0 (Streamlit course app)"
+PIXEL_DENSITIES = (1, 2)
+
+
+@lru_cache(maxsize=None)
+def load_manifest():
+    if not MANIFEST_PATH.exists():
+        return {}
+    return json.loads(MANIFEST_PATH.read_text())
+
+
+def local_image(url, width, manifest=None):
+    """Return ``(src, srcset)`` URLs for a vendored image at ``width``, or ``None``."""
+    entry = (load_manifest() if manifest is None else manifest).get(url)
+    if entry is None or str(width) not in entry["files"]:
+        return None
+    files = entry["files"][str(width)]
+    src = f"{STATIC_URL}/{files['1x']}"
+    srcset = ", ".join(f"{STATIC_URL}/{name} {density}" for density, name in files.items())
+    return src, srcset
+
+
+def vendor_image(url, widths, manifest, asset_dir=ASSET_DIR):
+    """Download ``url`` and write resized copies for each display width into ``asset_dir``."""
+    from PIL import Image
+
+    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        data = response.read()
+    digest = hashlib.sha256(data).hexdigest()
+
+    image = Image.open(io.BytesIO(data))
+    files = {}
+    for width in sorted(widths):
+        files[str(width)] = {}
+        for density in PIXEL_DENSITIES:
+            pixels = min(width * density, image.width)
+            name = f"{digest[:16]}-w{pixels}.png"
+            if not (asset_dir / name).exists():
+                resized = image.resize((pixels, round(image.height * pixels / image.width)), Image.LANCZOS)
+                resized.save(asset_dir / name, optimize=True)
+            files[str(width)][f"{density}x"] = name
+    manifest[url] = {"sha256": digest, "files": files}
+
+
+def deck_images():
+    """Map each remote image URL used in any deck to the widths it is shown at."""
+    from slides import DECKS, Image, load_deck
+
+    images = {}
+    for deck_id in DECKS:
+        for slide in load_deck(deck_id).SLIDES:
+            for block in slide.blocks:
+                if isinstance(block, Image) and block.url.startswith(("http://", "https://")):
+                    images.setdefault(block.url, set()).add(block.width)
+    return images
+
+
+def missing_images():
+    """Deck images (URL → widths) that the manifest has no file for at some width they are shown at."""
+    return {url: widths for url, widths in deck_images().items()
+            if any(local_image(url, width) is None for width in widths)}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true",
+                        help="list the images that are not vendored yet instead of downloading them")
+    args = parser.parse_args()
+    if args.check:
+        missing = missing_images()
+        for url, widths in missing.items():
+            print(f"Not vendored: {url} at widths {sorted(widths)}")
+        print(f"{len(missing)} slide image(s) would be missing offline")
+        raise SystemExit(1 if missing else 0)
+
+    ASSET_DIR.mkdir(parents=True, exist_ok=True)
+    manifest = dict(load_manifest())
+    for url, widths in deck_images().items():
+        print(f"Vendoring {url} at widths {sorted(widths)}")
+        vendor_image(url, widths, manifest)
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
@@ -0,0 +1,497 @@
+"""Micro-benchmarks for the expensive parts of the app.
+
+Run ``python benchmark.py`` to run everything, or pass benchmark names
+(e.g. ``python benchmark.py map``) to run a subset.
+"""
+import itertools
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+import plotly.io as pio
+import plotly.tools
+
+from datasets import load_dataset
+from export import EXPORTERS, export_plans
+from heatmap import ClassHeatmap, SettlementGrid
+from michigan_map import build_base_map, move_preview_pin, with_overlays
+from reports import FORMATS as REPORT_FORMATS, render_batch
+from scoring import GeoIndex, get_index, score_sites
+from storage import PlanStore
+
+
+def time_calls(func, repeat=50):
+    """Call ``func`` ``repeat`` times and return per-call timings in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(label, timings):
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(f"{label:<40} median {statistics.median(timings):8.2f} ms   p95 {p95:8.2f} ms")
+
+
+def ship_figure(fig):
+    """Mimic the work ``st.plotly_chart`` does to send a figure to the browser."""
+    figure = plotly.tools.return_figure_from_figure_or_data(fig, validate_figure=True)
+    return pio.to_json(figure, validate=False)
+
+
+def bench_map():
+    """Student Activity map: rebuilding per rerun vs. the cached base map."""
+    report("map: rebuild every rerun (before)", time_calls(lambda: ship_figure(build_base_map())))
+    base_map = build_base_map()
+    report("map: cached base map (after)", time_calls(lambda: ship_figure(base_map)))
+
+
+def bench_geometry():
+    """Map geometry: vertices and serialized size of the base map at each level of detail."""
+    from geometry import LOD_TOLERANCES, layer
+
+    for lod in LOD_TOLERANCES:
+        vertices = sum(len(part) for name in ("territory", "rivers", "lake_michigan", "swamps")
+                       for _, parts in layer(name, lod) for part in parts)
+        size = len(ship_figure(build_base_map(lod)))
+        print(f"{'geometry: ' + lod:<40} {vertices:8d} vertices   {size / 1024:6.1f} KiB")
+
+
+def bench_timeline():
+    """History map: one figure with every year's frame vs. rebuilding a year's map per rerun."""
+    import plotly.graph_objects as go
+
+    from geometry import layer
+    from michigan_map import (MAP_LAYOUT, TIMELINE_YEARS, build_timeline_map, default_lod, lake_trace,
+                              river_traces, swamp_traces, territory_trace, timeline_title, timeline_traces)
+
+    report("timeline: build all frames (once)", time_calls(build_timeline_map, repeat=5))
+    fig = build_timeline_map()
+    size = len(ship_figure(fig))
+    print(f"{'timeline: shipped once':<40} {size / 1024:8.1f} KiB for {len(TIMELINE_YEARS)} years")
+
+    # The rejected design: a server-side year slider rebuilding and shipping that year's map on every move
+    lod = default_lod()
+    roads, regions = layer("roads", lod), load_dataset("regional_settlement")
+    population = load_dataset("population_timeline")
+    years = itertools.cycle(TIMELINE_YEARS)
+
+    def one_year():
+        year_map = go.Figure()
+        year_map.add_trace(territory_trace(lod))
+        year_map.add_traces(list(river_traces(lod)))
+        year_map.add_trace(lake_trace(lod))
+        year_map.add_traces(list(swamp_traces(lod)))
+        year = next(years)
+        year_map.add_traces(timeline_traces(year, roads, regions))
+        year_map.update_layout(**MAP_LAYOUT)
+        year_map.update_layout(title=timeline_title(year, population))
+        return ship_figure(year_map)
+
+    report("timeline: rebuild one year per rerun", time_calls(one_year, repeat=20))
+
+
+def bench_preview():
+    """Slider drag: patching the preview pin vs. copying the map on every move."""
+    base_map = build_base_map()
+    report("preview: copy map + pin per move", time_calls(
+        lambda: ship_figure(move_preview_pin(with_overlays(base_map), 42.5, -84.5))))
+    session_map = with_overlays(base_map)
+    report("preview: patch pin trace per move", time_calls(
+        lambda: ship_figure(move_preview_pin(session_map, 42.5, -84.5))))
+
+
+def sample_plan(i):
+    return {
+        "section": f"HIS220-{i % 4 + 1:02d}",
+        "student_name": f"Student {i}",
+        "settlement_name": f"Settlement {i}",
+        "region": "Grand River Valley",
+        "latitude": 42.5,
+        "longitude": -84.5,
+        "priorities": ["Water access", "Fertile soil"],
+        "challenges": "Clearing the forest before winter.",
+        "resources": "River, timber, game.",
+        "vision": "A mill town.",
+        "strategy": "Shelter first, then wheat.",
+    }
+
+
+def bench_store(students=400):
+    """Load test: ``students`` sessions submitting plans at the same moment."""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = PlanStore(os.path.join(tmp, "plans.db"))
+        barrier = threading.Barrier(students)
+        timings = []
+
+        def submit(i):
+            barrier.wait()
+            start = time.perf_counter()
+            store.submit(sample_plan(i))
+            timings.append((time.perf_counter() - start) * 1000)
+
+        threads = [threading.Thread(target=submit, args=(i,)) for i in range(students)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        store.flush()
+        elapsed = (time.perf_counter() - start) * 1000
+
+        report(f"store: submit() with {students} at once", timings)
+        assert store.count() == students, f"expected {students} plans, found {store.count()}"
+        print(f"{'store: all plans committed':<40} {elapsed:8.2f} ms total")
+        report("store: lookup by student", time_calls(lambda: store.plans(student_name="Student 7")))
+
+
+def bench_heatmap(plans=10000):
+    """Class heatmap: incremental refresh vs. rebinning every stored plan."""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = PlanStore(os.path.join(tmp, "plans.db"))
+        for i in range(plans):
+            store.submit(dict(sample_plan(i), latitude=41.7 + (i % 43) / 10, longitude=-87.0 + (i % 45) / 10))
+        store.flush()
+
+        def full_rescan():
+            grid = SettlementGrid()
+            _, latitudes, longitudes = store.coordinates_since(0)
+            grid.add(latitudes, longitudes)
+
+        report(f"heatmap: rebin all {plans} plans", time_calls(full_rescan, repeat=20))
+        heatmap = ClassHeatmap(store)
+        heatmap.grid()
+        report("heatmap: incremental refresh", time_calls(heatmap.grid))
+
+
+def bench_export(plans=5000):
+    """Bulk export: time and peak Python memory for each streaming exporter."""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = PlanStore(os.path.join(tmp, "plans.db"))
+        for i in range(plans):
+            store.submit(sample_plan(i))
+        store.flush()
+        for fmt in EXPORTERS:
+            tracemalloc.start()
+            start = time.perf_counter()
+            out = export_plans(store, fmt)
+            elapsed = (time.perf_counter() - start) * 1000
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            size = len(out)
+            print(f"{'export: ' + fmt + f' ({plans} plans)':<40} {elapsed:8.2f} ms   "
+                  f"peak {peak / 2**20:6.2f} MiB   file {size / 2**20:6.2f} MiB")
+
+
+def bench_reports(plans=500):
+    """Report rendering: per-report time in each format when rendering a class batch."""
+    batch = [sample_plan(i) for i in range(plans)]
+    for fmt in REPORT_FORMATS:
+        timings = [t / plans for t in time_calls(lambda: render_batch(batch, fmt), repeat=10)]
+        report(f"reports: {fmt} (per report)", timings)
+
+
+def bench_scoring(plans=10000):
+    """Site scoring: the precomputed grid index vs. exact distances for a batch of archived plans."""
+    latitudes = [41.7 + (i % 43) / 10 for i in range(plans)]
+    longitudes = [-87.0 + (i % 45) / 10 for i in range(plans)]
+    report("scoring: build index (once)", time_calls(GeoIndex, repeat=5))
+    index = get_index()
+    report(f"scoring: exact distances ({plans} plans)", time_calls(
+        lambda: GeoIndex.exact(latitudes, longitudes), repeat=10))
+    report(f"scoring: indexed ({plans} plans)", time_calls(lambda: score_sites(latitudes, longitudes, index)))
+    report("scoring: indexed (one plan)", time_calls(lambda: score_sites([42.5], [-84.5], index)))
+
+
+def bench_regions(plans=10000):
+    """Region lookup: grid build, classifying a batch, and the consistency report over a store."""
+    from regions import RegionGrid, consistency_report, get_region_grid
+
+    latitudes = [41.7 + (i % 43) / 10 for i in range(plans)]
+    longitudes = [-87.0 + (i % 45) / 10 for i in range(plans)]
+    report("regions: build grid (once)", time_calls(RegionGrid, repeat=5))
+    grid = get_region_grid()
+    report(f"regions: classify {plans} points", time_calls(lambda: grid.classify(latitudes, longitudes)))
+    with tempfile.TemporaryDirectory() as tmp:
+        store = PlanStore(os.path.join(tmp, "plans.db"))
+        for i in range(plans):
+            store.submit(dict(sample_plan(i), latitude=latitudes[i], longitude=longitudes[i]))
+        store.flush()
+        report(f"regions: consistency report ({plans} plans)", time_calls(
+            lambda: consistency_report(store), repeat=5))
+
+
+def bench_catalog():
+    """Resource catalog: parsing it into the facet index, and filtering plus building every tab's list."""
+    from catalog import Catalog, get_catalog
+
+    table = load_dataset("resources")
+    report("catalog: build facet index (once)", time_calls(lambda: Catalog(table), repeat=20))
+    catalog = get_catalog()
+
+    def filter_and_list():
+        ids = catalog.match(type=["Map collection", "Database"], access=["Free"])
+        return [catalog.section_markdown(section, ids) for section in catalog.values("section")]
+
+    def uncached():
+        catalog._markdown.clear()
+        return filter_and_list()
+
+    report("catalog: filter + tab lists (first time)", time_calls(uncached, repeat=200))
+    report("catalog: filter + tab lists (cached)", time_calls(filter_and_list, repeat=200))
+
+
+def bench_search(chapters=50):
+    """Course search: index build, and query latency for this chapter and for ``chapters`` of them."""
+    from search import SearchIndex, documents
+
+    docs = list(documents())
+    report("search: build index (once)", time_calls(lambda: SearchIndex(docs), repeat=10))
+    queries = ["Erie Canal", "swamp drainage", "Tiffin survey 1815", "historical maps", "statehood"]
+    for label, index in (("1 chapter", SearchIndex(docs)), (f"{chapters} chapters", SearchIndex(docs * chapters))):
+        report(f"search: {len(queries)} queries, {label}", time_calls(
+            lambda: [index.search(query) for query in queries], repeat=200))
+
+
+def bench_linkcheck():
+    """Link checker against a local stand-in server: result states, rechecks, concurrency and host spacing."""
+    import asyncio
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import urlsplit
+
+    from linkcheck import check_links
+
+    class StandIn(BaseHTTPRequestHandler):
+        # Path → status; /ok revalidates with its ETag, /get-only refuses HEAD and /slow takes SLOW seconds
+        STATUS = {"/ok": 200, "/get-only": 200, "/gone": 404, "/flaky": 500, "/forbidden": 403, "/slow": 200}
+        SLOW = 0.3
+
+        def do_HEAD(self):
+            path = urlsplit(self.path).path
+            if path == "/get-only":
+                self.answer(405)
+            elif path == "/ok" and self.headers.get("If-None-Match") == '"v1"':
+                self.answer(304)
+            else:
+                self.answer(self.STATUS[path])
+
+        def do_GET(self):
+            self.answer(self.STATUS[urlsplit(self.path).path])
+
+        def answer(self, status):
+            # (method, host, path, status, start time); in-flight requests are counted for the cap
+            self.server.log.append((self.command, self.headers["Host"].split(":")[0], self.path, status,
+                                    time.monotonic()))
+            with self.server.lock:
+                self.server.in_flight += 1
+                self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+            if self.path.startswith("/slow"):
+                time.sleep(self.SLOW)
+            with self.server.lock:
+                self.server.in_flight -= 1
+            self.send_response(status)
+            if status in (200, 304):
+                self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    def run(urls, results, **options):
+        server.log.clear()
+        server.max_in_flight = 0
+        start = time.perf_counter()
+        checked = asyncio.run(check_links(urls, results, **options))
+        return checked, (time.perf_counter() - start) * 1000
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    server.lock, server.in_flight = threading.Lock(), 0
+    server.log = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    paths = ["/ok", "/get-only", "/gone", "/flaky", "/forbidden"]
+    urls = [base + path for path in paths]
+    results = {}
+    expected = [
+        {"/ok": "ok", "/get-only": "ok", "/gone": "dead", "/flaky": "failing", "/forbidden": "blocked"},
+        {"/ok": "ok", "/get-only": "ok", "/gone": "dead", "/flaky": "dead", "/forbidden": "blocked"},
+    ]
+    try:
+        for check, states in enumerate(expected, 1):
+            _, elapsed = run(urls, results, host_interval=0, force=True)
+            got = {url[len(base):]: results[url]["state"] for url in urls}
+            print(f"{f'linkcheck: check {check} ({len(urls)} links)':<40} {elapsed:8.2f} ms   "
+                  + ", ".join(f"{path} {state}" for path, state in got.items()))
+            if got != states:
+                raise RuntimeError(f"check {check}: expected {states}, got {got}")
+        entries = [(method, path, status) for method, _, path, status, _ in server.log]
+        if ("HEAD", "/ok", 304) not in entries:
+            raise RuntimeError("the recheck of /ok was not answered 304 Not Modified")
+        if [entry for entry in entries if entry[1] == "/get-only"] != [("HEAD", "/get-only", 405),
+                                                                       ("GET", "/get-only", 200)]:
+            raise RuntimeError("/get-only was not retried with GET after 405")
+
+        # TTL: fresh results are reused without a request, stale ones are checked again
+        checked, _ = run(urls, results, ttl=3600, host_interval=0)
+        if checked or server.log:
+            raise RuntimeError(f"fresh results were checked again: {checked}")
+        checked, _ = run(urls, results, ttl=0, host_interval=0)
+        if len(checked) != len(urls):
+            raise RuntimeError(f"stale results were not checked again: {len(checked)} of {len(urls)}")
+        print(f"{'linkcheck: TTL reuse':<40} fresh results reused, stale ones rechecked")
+
+        # Concurrency cap: eight slow links on one host, no host spacing
+        slow = [f"{base}/slow?{i}" for i in range(8)]
+        _, elapsed = run(slow, {}, concurrency=3, host_interval=0)
+        if server.max_in_flight != 3:
+            raise RuntimeError(f"expected at most 3 requests in flight, saw {server.max_in_flight}")
+        print(f"{'linkcheck: 8 slow links, concurrency 3':<40} {elapsed:8.2f} ms   max in flight 3")
+
+        # Host spacing: a slow link on another host holds the only slot while two links to this host queue
+        interval = 0.5
+        local = f"http://localhost:{server.server_port}"
+        _, elapsed = run([f"{local}/slow", f"{base}/ok?a", f"{base}/ok?b"], {}, concurrency=1,
+                         host_interval=interval, force=True)
+        starts = [entry[4] for entry in server.log if entry[1] == "127.0.0.1"]
+        gap = starts[1] - starts[0]
+        if gap < interval * 0.95:
+            raise RuntimeError(f"two requests to one host started {gap * 1000:.0f} ms apart, "
+                               f"less than {interval * 1000:.0f} ms")
+        print(f"{'linkcheck: host spacing ' + str(interval) + ' s':<40} {elapsed:8.2f} ms   "
+              f"requests {gap * 1000:.0f} ms apart")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def bench_assets():
+    """Image vendoring against a local stand-in server: file names, pixel sizes, manifest and srcset."""
+    import hashlib
+    import io
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from pathlib import Path
+
+    from PIL import Image
+
+    from assets import STATIC_URL, local_image, vendor_image
+
+    # A 1200x900 PNG, like the Slide 1 map; 2x of the 800 px width is capped at the source width
+    buffer = io.BytesIO()
+    Image.linear_gradient("L").resize((1200, 900)).convert("RGB").save(buffer, format="PNG")
+    png = buffer.getvalue()
+    digest = hashlib.sha256(png).hexdigest()
+
+    class StandIn(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.server.requests += 1
+            self.send_response(200)
+            self.send_header("Content-Type", "image/png")
+            self.send_header("Content-Length", str(len(png)))
+            self.end_headers()
+            self.wfile.write(png)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    server.requests = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/map.png"
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            asset_dir, manifest = Path(tmp), {}
+            start = time.perf_counter()
+            vendor_image(url, {400, 800}, manifest, asset_dir=asset_dir)
+            elapsed = (time.perf_counter() - start) * 1000
+
+            expected = {
+                "400": {"1x": f"{digest[:16]}-w400.png", "2x": f"{digest[:16]}-w800.png"},
+                "800": {"1x": f"{digest[:16]}-w800.png", "2x": f"{digest[:16]}-w1200.png"},
+            }
+            if manifest != {url: {"sha256": digest, "files": expected}}:
+                raise RuntimeError(f"unexpected manifest: {manifest}")
+            for pixels in (400, 800, 1200):
+                with Image.open(asset_dir / f"{digest[:16]}-w{pixels}.png") as image:
+                    if image.size != (pixels, pixels * 3 // 4):
+                        raise RuntimeError(f"w{pixels} file is {image.size[0]}x{image.size[1]}")
+            if sorted(path.name for path in asset_dir.iterdir()) != sorted(
+                    f"{digest[:16]}-w{pixels}.png" for pixels in (400, 800, 1200)):
+                raise RuntimeError(f"unexpected files: {sorted(path.name for path in asset_dir.iterdir())}")
+            src, srcset = local_image(url, 400, manifest)
+            if (src, srcset) != (f"{STATIC_URL}/{digest[:16]}-w400.png",
+                                 f"{STATIC_URL}/{digest[:16]}-w400.png 1x, {STATIC_URL}/{digest[:16]}-w800.png 2x"):
+                raise RuntimeError(f"unexpected src/srcset: {src!r}, {srcset!r}")
+            if local_image(url, 600, manifest) is not None:
+                raise RuntimeError("an unvendored width was served locally")
+
+            # Vendoring again keeps the existing files: same names, nothing rewritten
+            mtimes = {path.name: path.stat().st_mtime_ns for path in asset_dir.iterdir()}
+            vendor_image(url, {400, 800}, manifest, asset_dir=asset_dir)
+            if {path.name: path.stat().st_mtime_ns for path in asset_dir.iterdir()} != mtimes:
+                raise RuntimeError("vendoring the same image again rewrote its files")
+        print(f"{'assets: vendor one image at 2 widths':<40} {elapsed:8.2f} ms   "
+              f"{len(png) / 1024:.1f} KiB source, {server.requests} downloads, 3 files")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def import_time_ms(modules):
+    """Cold-import ``modules`` after streamlit in a fresh interpreter; return (ms, module count).
+
+    Uses ``python -X importtime`` and sums the self time of every module
+    imported after streamlit itself, i.e. the cost the page adds on top of it.
+    """
+    code = "import streamlit; print('--page--', file=__import__('sys').stderr); " + "; ".join(
+        f"import {module}" for module in modules)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    lines = result.stderr.split("--page--", 1)[1].splitlines()
+    self_us = [int(line.split("|")[0].split(":")[1]) for line in lines if line.startswith("import time:")]
+    return sum(self_us) / 1000, len(self_us)
+
+
+def bench_startup():
+    """Cold start: imports each page pulls in, vs. all of them (the old single app.py)."""
+    from views import PAGES
+
+    for label, module in PAGES.items():
+        ms, count = import_time_ms([module])
+        print(f"{'startup: ' + module:<40} {ms:8.2f} ms   {count:4d} modules")
+    ms, count = import_time_ms(list(PAGES.values()))
+    print(f"{'startup: all pages (before split)':<40} {ms:8.2f} ms   {count:4d} modules")
+
+
+BENCHMARKS = {
+    "map": bench_map,
+    "geometry": bench_geometry,
+    "timeline": bench_timeline,
+    "preview": bench_preview,
+    "store": bench_store,
+    "heatmap": bench_heatmap,
+    "export": bench_export,
+    "reports": bench_reports,
+    "scoring": bench_scoring,
+    "regions": bench_regions,
+    "catalog": bench_catalog,
+    "search": bench_search,
+    "assets": bench_assets,
+    "linkcheck": bench_linkcheck,
+    "startup": bench_startup,
+}
+
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        BENCHMARKS[name]()
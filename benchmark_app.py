@@ -0,0 +1,204 @@
+"""End-to-end benchmark: the real ``app.py`` driven headlessly through its main scenarios.
+
+Each scenario (paging through the slides, dragging the map sliders, filling in
+and submitting the settlement form, opening the resources page) runs in fresh
+AppTest sessions, a few times over. For every scenario it reports the first
+page load, the latency distribution of the reruns after it, the peak Python
+memory of one pass, and the size of what the app sends: the largest Plotly
+figure and the largest page, in serialized protobuf bytes. A run stops with an
+error if a collapsed expander or a hidden tab was sent with its content.
+
+``python benchmark_app.py --save`` stores the results as the baseline in
+``benchmark_baseline.json``; later runs compare against it and exit non-zero
+if any metric got worse by more than its tolerance. Latency depends on the
+machine, so keep the baseline from the machine that checks it.
+"""
+import argparse
+import gc
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from loadtest import click, goto, new_session, percentile, rerun, set_widget
+
+BASELINE_PATH = Path(__file__).parent / "benchmark_baseline.json"
+
+NEXT_SLIDE = click("Next Slide ➡️")
+ACTIVITY = goto("🗺️ Student Activity")
+
+# Scenario name → steps (step name, action before the rerun); every scenario starts with a fresh
+# session's first load, which is reported on its own rather than mixed into the rerun latencies
+SCENARIOS = {
+    "slides": [("open app", None)] + [("next slide", NEXT_SLIDE)] * 9,
+    "sliders": [("open app", None), ("open activity", ACTIVITY)] + [
+        (f"move {kind}", set_widget("slider", kind, value))
+        for kind, value in [("latitude", 42.6), ("longitude", -84.9), ("latitude", 43.1),
+                            ("longitude", -85.6), ("latitude", 43.4), ("longitude", -86.0)]
+    ],
+    "submit": [
+        ("open app", None),
+        ("open activity", ACTIVITY),
+        ("type name", set_widget("text_input", "student_name", "Student")),
+        ("type settlement", set_widget("text_input", "settlement_name", "Riverbend")),
+        ("choose region", set_widget("selectbox", "region", "Grand River Valley")),
+        ("tick priority", set_widget("checkbox", "water_access", True)),
+        ("write answer", set_widget("text_area", "vision", "A mill town on the Grand River.")),
+        ("submit plan", click("📝 Submit Your Settlement Plan")),
+    ],
+    "resources": [("open app", None), ("open resources", goto("📖 Resources & Library"))],
+}
+
+# Relative slack before a metric counts as a regression; latency is noisy, byte counts are not
+TOLERANCES = {
+    "first_load_ms": 0.5,
+    "p50_ms": 0.5,
+    "p95_ms": 0.5,
+    "peak_kib": 0.2,
+    "max_figure_kib": 0.05,
+    "max_page_kib": 0.05,
+}
+
+
+def iter_elements(node):
+    """Yield every element (leaf) under an AppTest tree node."""
+    children = getattr(node, "children", None)
+    if children is None:
+        yield node
+        return
+    for child in children.values():
+        yield from iter_elements(child)
+
+
+def payload_sizes(at):
+    """Serialized size in bytes of the largest Plotly figure and of the whole page."""
+    figures, page = [0], 0
+    for element in iter_elements(at._tree):
+        proto = getattr(element, "proto", None)
+        if proto is None:
+            continue
+        size = proto.ByteSize()
+        page += size
+        if element.type == "plotly_chart":
+            figures.append(size)
+    return max(figures), page
+
+
+def collapsed_content(at):
+    """Return the labels of collapsed expanders and hidden tabs that were sent with content.
+
+    Expanders and tabs are only filled in once opened (Streamlit 1.55's ``.open`` state), so a
+    collapsed expander must arrive empty and at most one tab of a tab set may have content.
+    """
+    found = []
+    for element in iter_elements_and_blocks(at._tree):
+        if element.type == "expander" and element.children:
+            key = element.proto.id.split("-", 2)[-1]
+            is_open = at.session_state[key] if key in at.session_state else element.proto.expanded
+            if not is_open:
+                found.append(element.label)
+        elif element.type == "tab_container":
+            filled = [tab.label for tab in element.children.values() if tab.children]
+            found.extend(filled[1:])
+    return found
+
+
+def iter_elements_and_blocks(node):
+    """Yield every node under an AppTest tree node, containers included."""
+    yield node
+    for child in getattr(node, "children", {}).values():
+        yield from iter_elements_and_blocks(child)
+
+
+def run_scenario(steps):
+    """Walk one fresh session through ``steps``; returns (latencies in ms, max figure bytes, max page bytes)."""
+    at = new_session()
+    latencies, max_figure, max_page = [], 0, 0
+    for _, action in steps:
+        latencies.append(rerun(at, action))
+        collapsed = collapsed_content(at)
+        if collapsed:
+            raise RuntimeError(f"collapsed sections were sent with content: {', '.join(collapsed)}")
+        figure, page = payload_sizes(at)
+        max_figure, max_page = max(max_figure, figure), max(max_page, page)
+    return latencies, max_figure, max_page
+
+
+def peak_memory(steps):
+    """Peak Python memory (KiB) allocated while one fresh session walks through ``steps``."""
+    gc.collect()
+    tracemalloc.start()
+    run_scenario(steps)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def measure(name, repeat):
+    steps = SCENARIOS[name]
+    run_scenario(steps)  # warm the process-wide caches so every repeat measures steady state
+    first_loads, latencies, max_figure, max_page = [], [], 0, 0
+    for _ in range(repeat):
+        timings, max_figure, max_page = run_scenario(steps)
+        first_loads.append(timings[0])
+        latencies.extend(timings[1:])
+    return {
+        "first_load_ms": round(statistics.median(first_loads), 1),
+        "reruns": len(latencies),
+        "p50_ms": round(statistics.median(latencies), 1),
+        "p95_ms": round(percentile(latencies, 95), 1),
+        "max_ms": round(max(latencies), 1),
+        "peak_kib": round(peak_memory(steps), 1),
+        "max_figure_kib": round(max_figure / 1024, 1),
+        "max_page_kib": round(max_page / 1024, 1),
+    }
+
+
+def regressions(results, baseline):
+    """Return (scenario, metric, baseline, current) for every metric worse than its tolerance allows."""
+    found = []
+    for name, metrics in results.items():
+        for metric, tolerance in TOLERANCES.items():
+            before = baseline.get(name, {}).get(metric)
+            if before is not None and metrics[metric] > before * (1 + tolerance):
+                found.append((name, metric, before, metrics[metric]))
+    return found
+
+
+def print_results(results, baseline):
+    columns = ["first_load_ms", "reruns", "p50_ms", "p95_ms", "max_ms", "peak_kib", "max_figure_kib", "max_page_kib"]
+    print(f"{'scenario':<10}" + "".join(f"{column:>15}" for column in columns))
+    for name, metrics in results.items():
+        print(f"{name:<10}" + "".join(f"{metrics[column]:>15}" for column in columns))
+        if name in baseline:
+            print(f"{'  baseline':<10}" + "".join(f"{baseline[name].get(column, '-'):>15}" for column in columns))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("scenarios", nargs="*", help=f"scenarios to run (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh sessions per scenario")
+    parser.add_argument("--save", action="store_true", help="store the results as the new baseline")
+    args = parser.parse_args()
+
+    # Keep benchmark plans out of the real database
+    os.environ.setdefault("PIONEER_DB_PATH", os.path.join(tempfile.mkdtemp(), "benchmark.db"))
+    baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+
+    start = time.perf_counter()
+    results = {name: measure(name, args.repeat) for name in args.scenarios or SCENARIOS}
+    print_results(results, baseline)
+    print(f"done in {time.perf_counter() - start:.1f} s")
+
+    if args.save:
+        BASELINE_PATH.write_text(json.dumps({**baseline, **results}, indent=2) + "\n")
+        print(f"baseline saved to {BASELINE_PATH.name}")
+    elif baseline:
+        found = regressions(results, baseline)
+        for name, metric, before, after in found:
+            print(f"REGRESSION {name}.{metric}: {before} -> {after}")
+        sys.exit(1 if found else 0)
@@ -0,0 +1,123 @@
+"""The resources page's link catalog (``data/resources.csv``) and its facet index.
+
+Each row of the catalog is one URL, with its source type, access level, era,
+tags and the page sections (tabs) it is listed in, so a link shared by several
+sections is stored once. The catalog is parsed into a ``Catalog`` once per
+version of the file; filtering by facet is a set intersection, and the
+markdown for each tab and filter combination is built once and reused.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+
+from datasets import dataset_token, load_dataset
+
+# Facets offered as filters on the resources page (tabs are the third facet, "section")
+FACETS = {"type": "Source type", "access": "Access"}
+
+# Tab lists kept per catalog before the cache is emptied
+MARKDOWN_CACHE_SIZE = 256
+
+# Tab order on the resources page; sections not listed here follow in catalog order
+SECTIONS = ["WCCCD Quick Links", "Primary Source Collections", "Historical Documents", "Maps & Geography",
+            "Educational Sites"]
+
+
+@dataclass(frozen=True)
+class Resource:
+    name: str
+    url: str
+    type: str
+    access: str
+    era: str
+    sections: tuple
+    tags: tuple
+    description: str
+
+    def markdown(self, dead=False):
+        flag = " ⚠️ *This link seems to be broken; try searching for the title.*" if dead else ""
+        return f"- [{self.name}]({self.url}): {self.description} *({self.access}; {self.era})*{flag}"
+
+
+def split_list(value):
+    """Split a ';'-separated cell (blank cells are read as NaN) into a tuple."""
+    if not isinstance(value, str):
+        return ()
+    return tuple(item.strip() for item in value.split(";") if item.strip())
+
+
+class Catalog:
+    """De-duplicated resources with a value → resource ids index per facet."""
+
+    def __init__(self, table):
+        self.resources = []
+        by_url = {}
+        for row in table.itertuples(index=False):
+            url = row.url.strip()
+            resource = Resource(row.name, url, row.type, row.access, row.era, split_list(row.sections),
+                                split_list(row.tags), row.description)
+            key = url.rstrip("/").lower()
+            if key in by_url:
+                # The same link listed twice: keep the first entry, shown in both entries' sections
+                first = by_url[key]
+                merged = Resource(**{**first.__dict__,
+                                     "sections": tuple(dict.fromkeys(first.sections + resource.sections)),
+                                     "tags": tuple(dict.fromkeys(first.tags + resource.tags))})
+                self.resources[self.resources.index(first)] = by_url[key] = merged
+            else:
+                self.resources.append(resource)
+                by_url[key] = resource
+
+        # facet → value → ids, with values in catalog order
+        self.facets = {}
+        for facet in ("section", *FACETS):
+            index = {}
+            for resource_id, resource in enumerate(self.resources):
+                values = resource.sections if facet == "section" else (getattr(resource, facet),)
+                for value in values:
+                    index.setdefault(value, set()).add(resource_id)
+            if facet == "section":
+                index = {section: index[section] for section in SECTIONS if section in index} | index
+            self.facets[facet] = {value: frozenset(ids) for value, ids in index.items()}
+        self.all_ids = frozenset(range(len(self.resources)))
+        # (section, ids, dead) → markdown; kept on the instance so it goes away with an old catalog
+        self._markdown = {}
+
+    def values(self, facet):
+        return list(self.facets[facet])
+
+    def match(self, **selected):
+        """Ids of the resources having one of the selected values of every facet given (empty selects all)."""
+        ids = self.all_ids
+        for facet, values in selected.items():
+            if values:
+                ids = ids & frozenset().union(*(self.facets[facet].get(value, ()) for value in values))
+        return ids
+
+    def section_markdown(self, section, ids, dead=frozenset()):
+        """The markdown list of ``section``'s resources among ``ids``, grouped by source type ('' if none).
+
+        Links whose URL is in ``dead`` (see ``linkcheck.dead_links``) are flagged as broken.
+        """
+        key = (section, ids, dead)
+        markdown = self._markdown.get(key)
+        if markdown is None:
+            groups = {}
+            for resource_id in sorted(self.facets["section"].get(section, frozenset()) & ids):
+                resource = self.resources[resource_id]
+                groups.setdefault(resource.type, []).append(resource.markdown(resource.url in dead))
+            markdown = "\n\n".join(f"**{group}:**\n" + "\n".join(lines) for group, lines in groups.items())
+            # Sessions share the catalog; another one may empty the cache at any point
+            if len(self._markdown) >= MARKDOWN_CACHE_SIZE:
+                self._markdown.clear()
+            self._markdown[key] = markdown
+        return markdown
+
+
+@lru_cache(maxsize=2)
+def _catalog(token):
+    return Catalog(load_dataset("resources"))
+
+
+def get_catalog():
+    """Return the shared catalog, rebuilt when ``data/resources.csv`` changes."""
+    return _catalog(dataset_token("resources"))
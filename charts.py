@@ -0,0 +1,76 @@
+"""Plotly charts shown on lecture slides.
+
+Charts are built from the datasets in ``data/`` and cached until those files
+change. Animated charts carry every frame and their own play button and year
+slider, so scrubbing through them runs entirely in the browser without a
+rerun.
+"""
+from functools import lru_cache
+
+from datasets import dataset_token, load_dataset
+
+
+@lru_cache(maxsize=4)
+def _population_growth(timeline_token, regions_token):
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    timeline = load_dataset("population_timeline")
+    regions = load_dataset("regional_settlement")
+    years = timeline["Year"].astype(int).tolist()
+    population = timeline["Population"].tolist()
+    developments = timeline["Key Development"].tolist()
+    statehood = 1837
+
+    def traces(upto):
+        """The four traces as they stand in year ``years[upto]``."""
+        shown = years[upto] >= statehood
+        return [
+            go.Scatter(x=years[:upto + 1], y=population[:upto + 1], mode="lines+markers",
+                       line=dict(color="darkgreen", width=3), name="Population",
+                       hovertemplate="%{x}: %{y:,} people<extra></extra>"),
+            go.Scatter(x=[years[upto]], y=[population[upto]], mode="markers+text",
+                       marker=dict(size=14, color="orange"), text=[developments[upto]],
+                       textposition="top left", showlegend=False, hoverinfo="skip"),
+            go.Bar(x=regions["Region"], y=regions["Early Settlers"], name="Early settlers",
+                   marker_color="lightgreen"),
+            go.Bar(x=regions["Region"], y=regions["By 1837"] if shown else [None] * len(regions),
+                   name="By 1837", marker_color="darkgreen"),
+        ]
+
+    fig = make_subplots(rows=1, cols=2, column_widths=[0.55, 0.45],
+                        subplot_titles=("Michigan population", "Settlers by region"))
+    for trace, col in zip(traces(0), (1, 1, 2, 2)):
+        fig.add_trace(trace, row=1, col=col)
+    fig.frames = [go.Frame(name=str(year), data=traces(i), traces=[0, 1, 2, 3]) for i, year in enumerate(years)]
+
+    frame_args = dict(frame=dict(duration=700, redraw=True), transition=dict(duration=300), mode="immediate")
+    fig.update_layout(
+        height=450,
+        barmode="group",
+        xaxis=dict(title="Year", range=[years[0] - 2, years[-1] + 2]),
+        yaxis=dict(title="Population", range=[0, max(population) * 1.25], tickformat=","),
+        yaxis2=dict(range=[0, regions[["Early Settlers", "By 1837"]].to_numpy().max() * 1.15]),
+        legend=dict(orientation="h", y=-0.25),
+        updatemenus=[dict(
+            type="buttons", x=0, y=-0.12, xanchor="left", showactive=False,
+            buttons=[dict(label="▶ Play", method="animate", args=[None, dict(frame_args, fromcurrent=True)]),
+                     dict(label="⏸ Pause", method="animate", args=[[None], dict(frame_args, frame=dict(duration=0))])],
+        )],
+        sliders=[dict(
+            active=0, x=0.12, y=-0.05, len=0.88, currentvalue=dict(prefix="Year: "),
+            steps=[dict(label=str(year), method="animate", args=[[str(year)], frame_args]) for year in years],
+        )],
+    )
+    return fig
+
+
+def population_growth():
+    """Animated population growth (slide 8) with the regional settler counts from slide 6."""
+    return _population_growth(dataset_token("population_timeline"), dataset_token("regional_settlement"))
+
+
+# Chart name → builder, referenced from decks as ``Chart("<name>")``
+CHARTS = {
+    "population_growth": population_growth,
+}
@@ -0,0 +1,273 @@
+"""Long-form text of the activity and resources pages.
+
+The pages render these sections and ``search`` indexes them, so the text lives
+here rather than inside the page code: building the search index never imports
+a page (or the libraries a page needs). Each section records where it is shown
+so a search result can take the reader straight to it: the header it sits under
+(``anchor``), and the tab or expander that has to be opened to see it.
+"""
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Section:
+    title: str
+    text: str
+    anchor: str = None
+    tab: str = None
+    expander: str = None
+
+
+# Widget key of the resource catalog tabs on the resources page (``Section.tab`` is a tab label)
+RESOURCES_TABS = "resources_tab"
+
+# Student Activity page: the expanders around the map and the plan form
+ACTIVITY = {
+    "background": Section(
+        "Historical Background",
+        """
+**The Mistake That Changed Michigan's History**
+
+In 1815, government surveyor Edward Tiffin was sent to explore Michigan Territory. His report was devastating: 
+he claimed most of the land was swampy and uninhabitable. Because of this negative assessment, War of 1812 
+veterans were given land in Illinois and Missouri instead of Michigan.
+
+**But the surveyors were wrong!**
+
+When pioneers finally ventured into Michigan's interior in the 1820s-1830s, they discovered:
+- The southern Lower Peninsula had incredibly fertile soil
+- Michigan became a national leader in wheat production
+- The Lake Michigan shoreline was perfect for fruit orchards (apples, peaches, cherries)
+- Even the swamplands, when drained, revealed some of the richest farmland
+
+This "error of the pioneers" delayed Michigan's growth by a decade but ultimately couldn't stop the flood 
+of settlers once word got out about the true nature of the land.
+""",
+        expander="background_expander",
+    ),
+    "discussion": Section(
+        "Class Discussion Questions",
+        """
+1. **Why did the government surveyors misjudge Michigan's potential?**
+   - Consider: Limited exploration, focusing on swamps, time of year visited
+
+2. **What would make you trust your own observations over official government reports?**
+   - Think about: Incentives, firsthand experience, risk vs. reward
+
+3. **How did the Erie Canal (completed 1825) change Michigan settlement?**
+   - Impact on: Transportation, access to markets, flow of settlers
+
+4. **What role did wetlands play in both helping and hindering settlement?**
+   - Negative: Disease, difficult travel, harder to farm initially
+   - Positive: Rich soil when drained, wildlife, fishing
+
+5. **How did early settlers' choices shape modern Michigan cities?**
+   - Think about: Detroit, Grand Rapids, Kalamazoo, Saginaw
+
+6. **What can we learn from the "error of the pioneers" for today?**
+   - Lessons about: First impressions, persistence, expert opinions, exploring beyond reports
+""",
+        anchor="discussion-questions",
+        expander="discussion_expander",
+    ),
+    "outcome": Section(
+        "What Actually Happened?",
+        """
+**The Truth Revealed (1825-1837)**
+
+Once the Erie Canal opened in 1825, thousands of New England settlers poured into Michigan. 
+They discovered:
+
+- **Southern Michigan** became prime wheat country and one of America's agricultural powerhouses
+- **Lake Michigan Coast** developed thriving fruit orchards (Michigan is still a top fruit producer today!)
+- **Grand Rapids** grew around furniture manufacturing using Michigan's abundant timber
+- **Detroit** exploded as a gateway city and later became the automotive capital
+- **Kalamazoo area** - Dutch immigrants turned swamplands into celery-growing regions
+- **Saginaw Valley** - The "uninhabitable swamps" became some of the richest farmland after drainage
+
+By 1837, Michigan had enough population to become a state - just 12 years after being dismissed as worthless swampland!
+
+**The Lesson:** Sometimes the experts are wrong. The pioneers who ignored the negative reports and explored 
+for themselves discovered one of America's most valuable territories.
+""",
+        anchor="historical-outcome",
+        expander="outcome_expander",
+    ),
+}
+
+# Resources & Library page, in page order
+RESOURCES = {
+    "library_services": Section(
+        "Access Your WCCCD Library Resources",
+        """
+### Access Your WCCCD Library Resources
+
+The WCCCD Library provides extensive resources for researching Michigan history, 
+primary sources, and historical documents.
+
+**Library Services Available:**
+- 📚 Historical books and textbooks
+- 🔍 Online databases and archives
+- 📰 Historical newspapers and periodicals
+- 🗺️ Maps and geographic resources
+- 👥 Research assistance from librarians
+- 💻 Digital collections
+""",
+        anchor="wcccd-library",
+    ),
+    "library_hours": Section(
+        "WCCCD Library Hours",
+        """
+**WCCCD Library Hours**
+
+Visit your campus library or access online resources 24/7
+
+[Library Website](https://www.wcccd.edu/students/library.html)
+""",
+        anchor="wcccd-library",
+    ),
+    "primary_text": Section(
+        "Essential Books on Michigan History",
+        """
+### Essential Books on Michigan History
+
+**Primary Text:**
+- **"Michigan: A History of the Wolverine State"** by Willis F. Dunbar and George S. May
+  - *The definitive textbook on Michigan history*
+  - Available at WCCCD Library
+  - ISBN: 978-0802870551
+
+**Additional Recommended Books:**
+""",
+        anchor="recommended-reading",
+    ),
+    "books_general": Section(
+        "Books: General Michigan History and the Pioneer Era",
+        """
+**General Michigan History:**
+- "A Most Superior Land: Life in the Upper Peninsula of Michigan" by Daniel J. Fountain
+- "Michigan: A History" by Bruce A. Rubenstein & Lawrence E. Ziewacz
+- "The Great Book of Michigan" by J. Alexander
+- "Detroit: An American Autopsy" by Charlie LeDuff
+
+**Pioneer and Settlement Era:**
+- "Pioneer Life in Michigan" by Mildred M. Comfort
+- "The Old Northwest" by R. Carlyle Buley
+- "The Land Looks After Us" by Miranda Belarde-Lewis
+""",
+        anchor="recommended-reading",
+    ),
+    "books_topics": Section(
+        "Books: Native American, Economic & Social History",
+        """
+**Native American History:**
+- "The Anishinaabeg of Michigan" by Michael Witgen
+- "Master of the Great Lakes" by Michael A. McDonnell
+- "Colonialism and the Ojibwe" by Dwayne Donald
+
+**Economic & Social History:**
+- "Frontier Industrialization" by R. Douglas Hurt
+- "The Great Lakes Frontier" by John Anthony Caruso
+- "Michigan: Visions of Our Past" by Richard J. Hathaway
+""",
+        anchor="recommended-reading",
+    ),
+    "research_steps": Section(
+        "How to Research Michigan History",
+        """
+### How to Research Michigan History
+
+**Step 1: Start Broad**
+- Read overview chapters in Dunbar & May
+- Get the big picture timeline
+- Identify specific topics that interest you
+
+**Step 2: Find Primary Sources**
+- Look for firsthand accounts
+- Check historical newspapers
+- Read letters, diaries, and documents
+- Examine maps from the period
+
+**Step 3: Consult Multiple Sources**
+- Compare different perspectives
+- Look for corroboration
+- Note contradictions
+- Consider biases
+""",
+        anchor="research-tips",
+    ),
+    "evaluating": Section(
+        "Evaluating Historical Sources",
+        """
+### Evaluating Historical Sources
+
+**Ask These Questions:**
+- Who created this source?
+- When was it created?
+- Why was it created?
+- Who was the intended audience?
+- What biases might exist?
+- Is it corroborated by other sources?
+
+**Citation Formats:**
+- [MLA Format Guide](https://owl.purdue.edu/owl/research_and_citation/mla_style/mla_formatting_and_style_guide/mla_formatting_and_style_guide.html)
+- [Chicago Manual Style](https://www.chicagomanualofstyle.org/)
+- [APA Format](https://apastyle.apa.org/)
+""",
+        anchor="research-tips",
+    ),
+    "projects": Section(
+        "Research Project Ideas",
+        """
+### Project Options
+
+1. **Primary Source Analysis**
+   - Analyze letters from Michigan pioneers
+   - Compare government surveys with settler accounts
+   - Study newspaper articles from 1820s-1830s
+
+2. **Local History Research**
+   - Research the founding of your Michigan city/town
+   - Interview local historians
+   - Visit local historical societies
+
+3. **Comparative Study**
+   - Compare Michigan settlement to other states
+   - Analyze different regions of Michigan
+   - Study immigrant group contributions
+
+4. **Biography Project**
+   - Research a Michigan pioneer
+   - Study Native American leaders
+   - Investigate government officials
+
+5. **Digital Humanities Project**
+   - Create an interactive timeline
+   - Map migration patterns
+   - Build a digital exhibit
+
+6. **Creative Projects**
+   - Write a historical fiction diary
+   - Create a museum exhibit proposal
+   - Develop an educational video
+""",
+        anchor="research-projects",
+        expander="projects_expander",
+    ),
+    "help": Section(
+        "Need Help? Contact Your WCCCD Librarian",
+        """
+### 📧 Need Help?
+
+**Contact Your WCCCD Librarian:**
+- Visit the library reference desk
+- Email: library@wcccd.edu
+- Call: Contact your campus library
+- Schedule a research consultation
+
+**Research Support Hours:**
+Monday-Friday: 8am-5pm  
+Online resources: Available 24/7
+""",
+    ),
+}
@@ -0,0 +1,63 @@
+"""Tables the slides and the map share, loaded from the files in ``data/``.
+
+``data/datasets.json`` lists every dataset: its file (CSV or Parquet), a
+version number to bump when its meaning changes, and optional column dtypes.
+Each table is parsed once and reused by every session until its file (or the
+manifest) changes on disk, so instructors can edit or add datasets without a
+restart or a code change. Callers get the shared DataFrame and must not modify
+it.
+"""
+import json
+import os
+import threading
+from pathlib import Path
+
+DATA_DIR = Path(__file__).parent / "data"
+MANIFEST_PATH = DATA_DIR / "datasets.json"
+
+_cache = {}  # cache key → (mtime_ns, parsed contents)
+_lock = threading.Lock()
+
+
+def _load_cached(key, path, parse):
+    """Return ``parse(path)``, reusing the previous result while the file's mtime is unchanged."""
+    mtime = os.stat(path).st_mtime_ns
+    with _lock:
+        cached = _cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+    value = parse(path)
+    with _lock:
+        _cache[key] = (mtime, value)
+    return value
+
+
+def manifest():
+    def parse(path):
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    return _load_cached(MANIFEST_PATH, MANIFEST_PATH, parse)
+
+
+def _read_table(path, dtypes):
+    import pandas as pd
+
+    if path.suffix == ".parquet":
+        table = pd.read_parquet(path)
+        return table.astype(dtypes) if dtypes else table
+    return pd.read_csv(path, dtype=dtypes)
+
+
+def load_dataset(name):
+    """Return dataset ``name`` as a (shared, read-only) DataFrame."""
+    entry = manifest()[name]
+    dtypes = entry.get("dtypes")
+    key = (entry["file"], json.dumps(dtypes, sort_keys=True))
+    return _load_cached(key, DATA_DIR / entry["file"], lambda path: _read_table(path, dtypes))
+
+
+def dataset_token(name):
+    """Return a value that changes whenever dataset ``name`` does, for use as a cache key."""
+    entry = manifest()[name]
+    return entry["version"], os.stat(DATA_DIR / entry["file"]).st_mtime_ns
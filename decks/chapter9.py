@@ -0,0 +1,395 @@
+"""Chapter 9: The Error of the Pioneers (Michigan Territory settlement, 1815-1837)."""
+from slides import Callout, Chart, Columns, Image, Markdown, Slide, Table
+
+TITLE = "The Error of the Pioneers"
+
+SLIDES = (
+    # Slide 1: Title
+    Slide(
+        title="Chapter 9: The Error of the Pioneers",
+        show_header=False,
+        blocks=(
+            Markdown("<h1 style='text-align: center; color: #2E86AB;'>Chapter 9: The Error of the Pioneers</h1>", html=True),
+            Markdown("<h2 style='text-align: center;'>Michigan Territory Settlement, 1815-1837</h2>", html=True),
+            Markdown("<br><br>", html=True),
+            Markdown("<h3 style='text-align: center;'>From 'Uninhabitable Swampland' to Agricultural Powerhouse</h3>", html=True),
+            Image(
+                "https://upload.wikimedia.org/wikipedia/commons/thumb/b/b5/Michigan_in_United_States.svg/1200px-Michigan_in_United_States.svg.png",
+                width=400,
+                alt="Map of the United States with Michigan highlighted",
+            ),
+        ),
+    ),
+    # Slide 2: The Survey Crisis
+    Slide(
+        title="The Survey That Changed History",
+        blocks=(
+            Columns(
+                (
+                    """
+                    ### 📋 The 1815 Tiffin Survey
+
+                    **Key Facts:**
+                    - **Who:** Surveyor General Edward Tiffin
+                    - **When:** 1815, after War of 1812
+                    - **Purpose:** Find land for war veterans
+                    - **Result:** Devastating report
+
+                    **Tiffin's Assessment:**
+                    > "Not more than one acre in a hundred, 
+                    > if there is one out of a thousand, 
+                    > that would admit of cultivation"
+                    """,
+                    """
+                    ### 🚫 Consequences
+
+                    **Immediate Impact:**
+                    - ❌ War of 1812 veterans given land in Illinois and Missouri instead
+                    - ❌ Michigan labeled "uninhabitable"
+                    - ❌ Settlement delayed by a decade
+                    - ❌ National reputation damaged
+
+                    **Why the Error?**
+                    - Limited exploration of interior
+                    - Focused on swampy areas
+                    - Surveyed during mosquito season
+                    - Didn't see cleared land potential
+                    """,
+                ),
+                spec=[1, 1],
+            ),
+        ),
+    ),
+    # Slide 3: The Geography Reality
+    Slide(
+        title="Michigan's Hidden Treasures",
+        blocks=(
+            Columns(
+                (
+                    """
+                    ### 🌾 Southern Lower Peninsula
+                    **Reality:** Prime farmland
+
+                    - Rich glacial soil
+                    - Perfect for wheat
+                    - Became national leader in grain
+                    - Diverse crop capability
+                    """,
+                    """
+                    ### 🍎 Lake Michigan Coast
+                    **Reality:** Fruit paradise
+
+                    - Moderated climate
+                    - Perfect for orchards
+                    - Apples, peaches, cherries
+                    - Still top producer today
+                    """,
+                    """
+                    ### 💧 "Swamplands"
+                    **Reality:** Richest soil
+
+                    - When drained = gold
+                    - Celery production (Kalamazoo)
+                    - Sugar beets
+                    - Premium agricultural land
+                    """,
+                ),
+                spec=3,
+            ),
+            Callout("success", "💡 **The Lesson:** Surface appearances deceived the surveyors. The 'useless' land was actually one of America's most valuable territories!"),
+        ),
+    ),
+    # Slide 4: The Turning Point
+    Slide(
+        title="1825: Everything Changes",
+        blocks=(
+            Markdown("### 🚢 The Erie Canal Opens"),
+            Columns(
+                (
+                    """
+                    **Before the Canal (pre-1825):**
+                    - Detroit to NYC: 3-4 weeks overland
+                    - Expensive, dangerous journey
+                    - Limited access to markets
+                    - Population: ~8,000 in territory
+                    """,
+                    """
+                    **After the Canal (1825+):**
+                    - Detroit to NYC: 8-10 days by water
+                    - Affordable transportation
+                    - Direct market access
+                    - By 1837: 175,000+ residents!
+                    """,
+                ),
+                spec=[1, 1],
+            ),
+            Callout("info", "📊 **Migration Surge:** 'It seemed as if all New England were coming' - Contemporary observer"),
+            Markdown("""
+                ### 🏃 The Pioneer Rush
+
+                **Who came?**
+                - New England farmers seeking new land
+                - European immigrants (Dutch, German, Irish)
+                - Former soldiers curious about reports
+                - Entrepreneurs seeing opportunity
+
+                **What they found:**
+                - Reports were wrong
+                - Land was incredibly fertile
+                - Opportunities everywhere
+                - A 'promised land'
+                """),
+        ),
+    ),
+    # Slide 5: Pioneer Challenges
+    Slide(
+        title="Life on the Michigan Frontier",
+        blocks=(
+            Columns(
+                (
+                    """
+                    ### 😰 Real Challenges
+
+                    **Physical Obstacles:**
+                    - Dense old-growth forests
+                    - Actual swamps and wetlands
+                    - Mosquito-borne "ague" (malaria-like illness)
+                    - Harsh winters
+                    - Isolation from civilization
+
+                    **Survival Needs:**
+                    - Clear land (backbreaking work)
+                    - Build shelter before winter
+                    - Establish water source
+                    - Plant crops immediately
+                    - Create relationships with Native Americans
+                    """,
+                    """
+                    ### 💪 Pioneer Solutions
+
+                    **Community Response:**
+                    - Barn-raising gatherings
+                    - Shared labor and tools
+                    - Trading with existing settlements
+                    - Learning from Native techniques
+                    - Gradual land clearing
+
+                    **Economic Strategies:**
+                    - Wheat as cash crop
+                    - Timber sales
+                    - Fur trading
+                    - Fruit cultivation
+                    - Mill operations
+                    """,
+                ),
+                spec=2,
+            ),
+        ),
+    ),
+    # Slide 6: Settlement Patterns
+    Slide(
+        title="Where Did Pioneers Settle?",
+        blocks=(
+            Table(dataset="regional_settlement"),
+            Markdown("""
+                ### 🎯 Settlement Priorities
+
+                **Most Successful Settlements Had:**
+                1. **Water Access** - Rivers or lakes for transportation
+                2. **Mixed Economy** - Not just farming
+                3. **Community** - Mutual support systems
+                4. **Trade Routes** - Connection to markets
+                5. **Diverse Resources** - Timber, farmland, water power
+                """),
+        ),
+    ),
+    # Slide 7: Native American Impact
+    Slide(
+        title="The Native American Perspective",
+        blocks=(
+            Columns(
+                (
+                    """
+                    ### 🌍 Original Inhabitants
+
+                    **Michigan's Native Nations:**
+                    - Anishinaabe (Ojibwe/Chippewa)
+                    - Odawa (Ottawa)
+                    - Potawatomi
+                    - Wyandot (Huron)
+                    - Miami
+
+                    **Their Relationship with the Land:**
+                    - Lived here for thousands of years
+                    - Sustainable hunting and agriculture
+                    - Sacred sites throughout territory
+                    - Complex trade networks
+                    - Deep environmental knowledge
+                    """,
+                    """
+                    ### 📜 Treaty Era (1819-1842)
+
+                    **Land Cessions:**
+                    - 1819-1822: Lewis Cass treaties
+                    - Gradual loss of territory
+                    - By 1842: Most land ceded
+                    - Forced relocations
+                    - Broken promises
+
+                    **Impact on Pioneers:**
+                    - Native knowledge crucial to survival
+                    - Trade relationships essential
+                    - Trails became roads
+                    - Place names preserved
+                    - Cultural exchange occurred
+                    """,
+                ),
+                spec=[1, 1],
+            ),
+            Callout("warning", "⚠️ **Important Context:** Pioneer success came at devastating cost to Native communities through forced removal and broken treaties."),
+        ),
+    ),
+    # Slide 8: Economic Transformation
+    Slide(
+        title="From 'Worthless' to Wealthy",
+        blocks=(
+            Markdown("### 📈 Michigan's Economic Evolution"),
+            Table(dataset="population_timeline"),
+            Chart("population_growth"),
+            Columns(
+                (
+                    """
+                    ### 🌾 Agriculture
+                    - Wheat production leader
+                    - Fruit orchards boom
+                    - Dairy farming
+                    - Sugar beets
+                    - Mint production
+                    """,
+                    """
+                    ### 🏭 Industry
+                    - Lumber mills
+                    - Flour mills
+                    - Furniture (Grand Rapids)
+                    - Mining (Upper Peninsula)
+                    - Manufacturing centers
+                    """,
+                    """
+                    ### 🏙️ Urban Growth
+                    - Detroit: Major port
+                    - Grand Rapids: Furniture
+                    - Kalamazoo: Celery/paper
+                    - Saginaw: Lumber
+                    - Ann Arbor: Education
+                    """,
+                ),
+                spec=3,
+            ),
+        ),
+    ),
+    # Slide 9: Statehood Achievement
+    Slide(
+        title="The Road to Statehood",
+        blocks=(
+            Markdown("""
+                ### 🏛️ Michigan Becomes the 26th State
+                **January 26, 1837**
+                """),
+            Columns(
+                (
+                    """
+                    ### Requirements Met
+
+                    **Constitutional Requirements:**
+                    - ✅ 60,000 residents (had 175,000!)
+                    - ✅ Territorial government functioning
+                    - ✅ State constitution written
+                    - ✅ Congressional approval
+
+                    **The Obstacle:**
+                    - Toledo Strip boundary dispute with Ohio
+                    - Lost Toledo (valuable port)
+                    - Gained Upper Peninsula as compensation
+                    - Initially seen as bad deal!
+                    """,
+                    """
+                    ### Historical Irony
+
+                    **From Rejection to Success:**
+                    - 1815: "Not worth defending"
+                    - 1837: 26th state of the Union
+                    - 22 years from despair to statehood!
+
+                    **The Upper Peninsula 'Consolation':**
+                    - Seemed worthless at first
+                    - Discovered: Massive copper deposits
+                    - Discovered: Rich iron ore
+                    - Became mining powerhouse
+                    - Another "expert error" corrected!
+                    """,
+                ),
+                spec=[1, 1],
+            ),
+        ),
+    ),
+    # Slide 10: Lessons and Legacy
+    Slide(
+        title="Lessons from the Error of the Pioneers",
+        blocks=(
+            Markdown("### 🎓 What Can We Learn?"),
+            Columns(
+                (
+                    """
+                    ### Historical Lessons
+
+                    **1. Don't Trust Limited Observations**
+                    - Tiffin surveyed during worst season
+                    - Didn't explore thoroughly
+                    - Lacked agricultural perspective
+
+                    **2. Perception vs. Reality**
+                    - Surface conditions misleading
+                    - Potential hidden beneath challenges
+                    - Time reveals true value
+
+                    **3. Human Determination Matters**
+                    - Pioneers didn't give up
+                    - Transformed "worthless" land
+                    - Innovation overcame obstacles
+                    """,
+                    """
+                    ### Modern Applications
+
+                    **Critical Thinking:**
+                    - Question expert opinions
+                    - Seek multiple perspectives
+                    - Verify with primary sources
+                    - Consider biases and context
+
+                    **Environmental Understanding:**
+                    - Wetlands actually valuable
+                    - "Wastelands" often ecosystems
+                    - Development has tradeoffs
+                    - Historical wisdom matters
+
+                    **Opportunity Recognition:**
+                    - Others' rejections = your opportunity
+                    - Look beyond obvious
+                    - Challenge conventional wisdom
+                    """,
+                ),
+                spec=[1, 1],
+            ),
+            Callout("success", """
+                ### 🌟 Bottom Line
+
+                The "Error of the Pioneers" wasn't made by the pioneers themselves—it was made by the experts who 
+                dismissed Michigan without truly understanding it. The pioneers who ignored the negative reports 
+                and explored for themselves discovered one of America's greatest treasures.
+
+                **Ask your students:** Where in your life might expert opinion be wrong? What "useless" opportunities 
+                might actually be valuable if explored with fresh eyes?
+                """),
+        ),
+    ),
+)
@@ -0,0 +1,62 @@
+"""Classroom deployment mode: one server process serving several sections.
+
+Start the server with ``PIONEER_CLASSROOM=1`` and the first session warms every
+process-wide cache (slides, charts, datasets, geometry, maps, the scoring,
+region and search indexes) before anyone else needs them. Sessions also stop keeping a
+private copy of the activity map: they borrow one of a small pool of shared
+map figures for the moment it takes to send it, so memory per student stays
+flat however many students connect.
+"""
+import os
+import queue
+from contextlib import contextmanager
+
+CLASSROOM = os.environ.get("PIONEER_CLASSROOM", "").lower() in ("1", "true", "yes")
+
+# Shared map figures in classroom mode; more means less waiting under heavy load
+MAP_POOL_SIZE = int(os.environ.get("PIONEER_MAP_POOL", "4"))
+
+
+class FigurePool:
+    """A fixed set of interchangeable figures, lent to one session at a time."""
+
+    def __init__(self, factory, size=MAP_POOL_SIZE):
+        self._figures = queue.Queue()
+        for _ in range(size):
+            self._figures.put(factory())
+
+    @contextmanager
+    def borrow(self):
+        """Lend a figure for the duration of the ``with`` block (patch it, then send it)."""
+        fig = self._figures.get()
+        try:
+            yield fig
+        finally:
+            self._figures.put(fig)
+
+
+def warmup():
+    """Load every immutable resource into its process-wide cache."""
+    from datasets import load_dataset, manifest
+    from geometry import LOD_TOLERANCES, layer
+    from regions import get_region_grid
+    from scoring import get_index
+    from search import get_index as get_search_index
+    from slides import DECKS, load_deck, prefetch
+    from views import PAGES, load_page, student_activity
+
+    for name in manifest():
+        load_dataset(name)
+    for name in ("territory", "rivers", "lake_michigan", "swamps", "roads", "regions"):
+        for lod in LOD_TOLERANCES:
+            layer(name, lod)
+    for deck_id in DECKS:
+        for number in range(1, len(load_deck(deck_id).SLIDES) + 1):
+            prefetch(deck_id, number)
+    get_index()
+    get_region_grid()
+    get_search_index()
+
+    for label in PAGES:
+        load_page(label)
+    student_activity.warm_maps()
@@ -0,0 +1,60 @@
+"""Server-side autosave for in-progress settlement plans.
+
+Field edits are first collected in a per-session buffer (in session state) and
+only written here every few seconds, so a burst of edits costs one store
+write. The store is bounded: the least recently used drafts are dropped once
+``max_sessions`` is reached, and drafts untouched for ``ttl_seconds`` are
+treated as abandoned and evicted.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+# Seconds between buffer flushes
+FLUSH_INTERVAL = 5.0
+# Long answers are kept, but a single field can't grow without bound
+MAX_FIELD_CHARS = 20_000
+
+
+class DraftStore:
+    """LRU + TTL bounded map of session id → draft fields."""
+
+    def __init__(self, max_sessions=1000, ttl_seconds=4 * 60 * 60):
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self._drafts = OrderedDict()  # session id → (last write time, fields)
+        self._lock = threading.Lock()
+
+    def save(self, session_id, fields):
+        """Merge ``fields`` into the session's draft."""
+        fields = {key: value[:MAX_FIELD_CHARS] if isinstance(value, str) else value
+                  for key, value in fields.items()}
+        now = time.monotonic()
+        with self._lock:
+            _, draft = self._drafts.pop(session_id, (None, {}))
+            draft.update(fields)
+            self._drafts[session_id] = (now, draft)
+            self._evict(now)
+
+    def restore(self, session_id):
+        """Return a copy of the session's draft (empty if there is none)."""
+        with self._lock:
+            entry = self._drafts.get(session_id)
+            if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+                return {}
+            return dict(entry[1])
+
+    def discard(self, session_id):
+        with self._lock:
+            self._drafts.pop(session_id, None)
+
+    def __len__(self):
+        return len(self._drafts)
+
+    def _evict(self, now):
+        # Oldest writes are at the front, so stop at the first draft that is still fresh
+        while self._drafts:
+            session_id, (written, _) = next(iter(self._drafts.items()))
+            if len(self._drafts) <= self.max_sessions and now - written <= self.ttl_seconds:
+                break
+            del self._drafts[session_id]
@@ -0,0 +1,81 @@
+"""Bulk exports of stored settlement plans.
+
+Every exporter pages through the store with ``PlanStore.iter_plans`` and
+writes each batch straight to a spooled temporary file, so only one batch of
+plan rows is held at a time. The finished file is still returned as bytes:
+Streamlit keeps the whole download in memory while it serves it.
+"""
+import csv
+import io
+import re
+import tempfile
+import zipfile
+
+from reports import render_batch
+from storage import PLAN_COLUMNS
+
+EXPORT_COLUMNS = ["id", *PLAN_COLUMNS]
+
+# Spill exports to disk once they grow past this many bytes
+SPOOL_SIZE = 1024 * 1024
+
+
+def write_csv(store, out, **filters):
+    """Write matching plans to the binary file ``out`` as UTF-8 CSV."""
+    text = io.TextIOWrapper(out, encoding="utf-8", newline="", write_through=True)
+    writer = csv.DictWriter(text, fieldnames=EXPORT_COLUMNS)
+    writer.writeheader()
+    for batch in store.iter_plans(**filters):
+        writer.writerows(dict(plan, priorities="; ".join(plan["priorities"])) for plan in batch)
+    text.detach()
+
+
+def write_parquet(store, out, **filters):
+    """Write matching plans to ``out`` as Parquet, one row group per batch."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        ("id", pa.int64()),
+        *[(column, pa.float64() if column in ("latitude", "longitude") else pa.string())
+          for column in PLAN_COLUMNS if column != "priorities"],
+        ("priorities", pa.list_(pa.string())),
+    ])
+    with pq.ParquetWriter(out, schema) as writer:
+        for batch in store.iter_plans(**filters):
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+
+
+def report_filename(plan):
+    """Return the path of ``plan``'s text report inside the ZIP export."""
+    section = plan["section"] or "no-section"
+    name = f"{plan['id']:05d}_{plan['student_name']}_{plan['settlement_name']}"
+    return f"{safe_filename(section)}/{safe_filename(name)}.txt"
+
+
+def safe_filename(name):
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", name).strip("_") or "plan"
+
+
+def write_report_zip(store, out, **filters):
+    """Write one text report per matching plan into a ZIP archive."""
+    with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for batch in store.iter_plans(**filters):
+            for plan, report in zip(batch, render_batch(batch, "text")):
+                archive.writestr(report_filename(plan), report)
+
+
+EXPORTERS = {
+    "csv": (write_csv, "text/csv"),
+    "parquet": (write_parquet, "application/vnd.apache.parquet"),
+    "zip": (write_report_zip, "application/zip"),
+}
+
+
+def export_plans(store, fmt, **filters):
+    """Run the ``fmt`` exporter and return the finished file as bytes for ``st.download_button``."""
+    writer, _ = EXPORTERS[fmt]
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE) as out:
+        writer(store, out, **filters)
+        out.seek(0)
+        return out.read()
@@ -0,0 +1,69 @@
+"""Class-wide settlement density aggregated from every submitted plan.
+
+Plans are binned into a fixed latitude/longitude grid. Each grid remembers the
+last plan id it has counted, so a refresh only reads and bins plans submitted
+since then instead of rescanning the whole table.
+"""
+import threading
+
+import numpy as np
+
+# Same extent as the territory map axes; 0.1° cells are centred on the slider values
+LON_RANGE = (-87.5, -82.0)
+LAT_RANGE = (41.5, 46.5)
+CELL_SIZE = 0.1
+
+
+def cell_centres(value_range, cell_size):
+    """Cell centres from ``value_range[0]`` to ``value_range[1]`` inclusive, ``cell_size`` apart."""
+    start, stop = value_range
+    return start + cell_size * np.arange(round((stop - start) / cell_size) + 1)
+
+
+class SettlementGrid:
+    """Counts of settlement plans per grid cell."""
+
+    def __init__(self, lon_range=LON_RANGE, lat_range=LAT_RANGE, cell_size=CELL_SIZE):
+        self.lon0, self.lat0, self.cell_size = lon_range[0], lat_range[0], cell_size
+        # Cell centres; a pin on a slider value is a centre, never on an edge between two cells
+        self.lon_centres = cell_centres(lon_range, cell_size)
+        self.lat_centres = cell_centres(lat_range, cell_size)
+        self.counts = np.zeros((len(self.lat_centres), len(self.lon_centres)), dtype=np.int64)
+        self.last_id = 0
+
+    def add(self, latitudes, longitudes):
+        """Bin a batch of coordinates into the grid; points off the map are ignored."""
+        rows = np.rint((np.asarray(latitudes, dtype=float) - self.lat0) / self.cell_size).astype(int)
+        cols = np.rint((np.asarray(longitudes, dtype=float) - self.lon0) / self.cell_size).astype(int)
+        inside = (rows >= 0) & (rows < self.counts.shape[0]) & (cols >= 0) & (cols < self.counts.shape[1])
+        np.add.at(self.counts, (rows[inside], cols[inside]), 1)
+
+    @property
+    def total(self):
+        return int(self.counts.sum())
+
+    def trace_data(self):
+        """Return cell centres and counts, with empty cells as NaN so they draw transparent."""
+        z = np.where(self.counts > 0, self.counts, np.nan)
+        return self.lon_centres, self.lat_centres, z
+
+
+class ClassHeatmap:
+    """Incrementally updated grids for the plans in a ``PlanStore``, one per term/section filter."""
+
+    def __init__(self, store):
+        self.store = store
+        self._grids = {}
+        self._lock = threading.Lock()
+
+    def grid(self, term=None, section=None):
+        """Return the up-to-date grid for plans matching ``term``/``section`` (``None`` = all)."""
+        with self._lock:
+            grid = self._grids.get((term, section))
+            if grid is None:
+                grid = self._grids[(term, section)] = SettlementGrid()
+            ids, latitudes, longitudes = self.store.coordinates_since(grid.last_id, term=term, section=section)
+            if len(ids):
+                grid.add(latitudes, longitudes)
+                grid.last_id = int(ids.max())
+            return grid
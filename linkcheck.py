@@ -0,0 +1,257 @@
+"""Out-of-band health checks for the links in the resource catalog.
+
+``python linkcheck.py`` checks every URL in ``data/resources.csv`` and writes
+the results to ``link_health.json`` (set ``PIONEER_LINK_HEALTH`` to put it
+somewhere else); run it from cron, or start it from the instructor panel on the
+resources page. The page itself never touches the network: it only reads the
+results file, once per version of it.
+
+Checks run concurrently on an asyncio event loop, with blocking ``urllib``
+requests handed to a small thread pool. At most ``concurrency`` requests are in
+flight, and requests to the same host start at least ``host_interval`` seconds
+apart. A result is reused for ``ttl`` seconds; after that the link is checked
+again with the ``ETag``/``Last-Modified`` validators the server sent, so an
+unchanged page answers ``304 Not Modified`` without a body.
+
+A link is ``dead`` when the server says it is gone (404, 410) or when it fails
+(5xx, timeout, connection error) on two checks in a row, so one bad minute on a
+library's server doesn't flag it. Sites that refuse automated requests (401,
+403, 429) are reported as ``blocked`` and never flagged.
+"""
+import argparse
+import asyncio
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+LINK_HEALTH_PATH = os.environ.get("PIONEER_LINK_HEALTH", "link_health.json")
+
+USER_AGENT = "his220-link-checker/1.0 (Streamlit course app)"
+# Seconds a result is reused before the link is checked again
+TTL = 24 * 60 * 60
+TIMEOUT = 15
+GONE = (404, 410)
+BLOCKED = (401, 403, 429)
+# Consecutive failed checks before a link that isn't gone is flagged
+DEAD_AFTER = 2
+
+
+def classify(status, failures):
+    """The state of a link: ``ok``, ``blocked``, ``failing`` or ``dead``."""
+    if status in GONE:
+        return "dead"
+    if status in BLOCKED:
+        return "blocked"
+    if status is not None and status < 400:
+        return "ok"
+    return "dead" if failures >= DEAD_AFTER else "failing"
+
+
+class HostThrottle:
+    """Spaces out the start of requests to the same host by ``interval`` seconds."""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._next = {}
+        self._locks = defaultdict(asyncio.Lock)
+
+    async def acquire(self, host, slots):
+        """Wait for ``host``'s turn, then for one of ``slots``; the caller releases the slot.
+
+        The host's next start is counted from when the slot is taken, so requests
+        that queued on busy slots can't start together once slots free up.
+        """
+        async with self._locks[host]:
+            loop = asyncio.get_running_loop()
+            delay = self._next.get(host, 0) - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await slots.acquire()
+            self._next[host] = loop.time() + self.interval
+
+
+def fetch(url, previous, timeout=TIMEOUT):
+    """Request ``url`` (blocking) and return ``(status, headers, error)``.
+
+    Sends ``HEAD``, falling back to a ``GET`` (whose body is never read) for
+    servers that don't allow ``HEAD``. A link that was fine last time is asked
+    only whether it changed since, with the validators from ``previous``.
+    """
+    headers = {"User-Agent": USER_AGENT}
+    if previous.get("state") == "ok":
+        if previous.get("etag"):
+            headers["If-None-Match"] = previous["etag"]
+        if previous.get("last_modified"):
+            headers["If-Modified-Since"] = previous["last_modified"]
+    for method in ("HEAD", "GET"):
+        request = urllib.request.Request(url, headers=headers, method=method)
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                return response.status, response.headers, None
+        except urllib.error.HTTPError as error:
+            if error.code in (405, 501) and method == "HEAD":
+                continue
+            return error.code, error.headers, None
+        except (urllib.error.URLError, OSError, ValueError) as error:
+            return None, {}, str(getattr(error, "reason", error))
+
+
+async def check_links(urls, results, ttl=TTL, concurrency=8, host_interval=1.0, force=False):
+    """Check every URL in ``urls`` whose result in ``results`` is missing or stale.
+
+    ``results`` maps URL → result and is updated in place; returns the URLs checked.
+    """
+    now = time.time()
+    stale = [url for url in dict.fromkeys(urls)
+             if force or now - results.get(url, {}).get("checked_at", 0) >= ttl]
+    throttle = HostThrottle(host_interval)
+    slots = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+
+    async def check(url, executor):
+        previous = results.get(url, {})
+        # Wait for the host's turn before taking a slot, so a slow host doesn't hold up the others
+        await throttle.acquire(urlsplit(url).hostname or "", slots)
+        try:
+            started = time.perf_counter()
+            status, headers, error = await loop.run_in_executor(executor, fetch, url, previous)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+        finally:
+            slots.release()
+        etag, last_modified = headers.get("ETag"), headers.get("Last-Modified")
+        if status == 304:
+            # Unchanged since the last check: keep the validators it was sent with
+            status = previous["status"]
+            etag, last_modified = etag or previous.get("etag"), last_modified or previous.get("last_modified")
+        failed = status is None or status >= 500
+        failures = previous.get("failures", 0) + 1 if failed else 0
+        results[url] = {
+            "status": status,
+            "state": classify(status, failures),
+            "failures": failures,
+            "error": error,
+            "etag": etag,
+            "last_modified": last_modified,
+            "elapsed_ms": round(elapsed_ms, 1),
+            "checked_at": time.time(),
+        }
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="linkcheck") as executor:
+        await asyncio.gather(*(check(url, executor) for url in stale))
+    return stale
+
+
+def read_results(path=LINK_HEALTH_PATH):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def write_results(results, path=LINK_HEALTH_PATH):
+    # Write a new file and swap it in, so the page never reads a half-written one
+    partial = f"{path}.partial"
+    with open(partial, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    os.replace(partial, path)
+
+
+def run_check(urls=None, path=LINK_HEALTH_PATH, **options):
+    """Check the catalog's links (or ``urls``) and save the results; returns ``(results, checked URLs)``."""
+    if urls is None:
+        from catalog import get_catalog
+
+        urls = [resource.url for resource in get_catalog().resources]
+    urls = list(urls)
+    results = {url: result for url, result in read_results(path).items() if url in urls}
+    checked = asyncio.run(check_links(urls, results, **options))
+    write_results(results, path)
+    return results, checked
+
+
+_background = {"thread": None}
+_background_lock = threading.Lock()
+
+
+def start_background_check(**options):
+    """Run ``run_check`` in a daemon thread unless one is already running; returns whether it started."""
+    with _background_lock:
+        if _background["thread"] is not None and _background["thread"].is_alive():
+            return False
+        _background["thread"] = threading.Thread(target=run_check, kwargs=options, name="linkcheck", daemon=True)
+        _background["thread"].start()
+        return True
+
+
+def check_running():
+    thread = _background["thread"]
+    return thread is not None and thread.is_alive()
+
+
+@lru_cache(maxsize=2)
+def _load(path, mtime):
+    return read_results(path)
+
+
+def load_health(path=LINK_HEALTH_PATH):
+    """The saved results, re-read only when the file changes (``{}`` before the first check)."""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    return _load(path, mtime)
+
+
+def dead_links(path=LINK_HEALTH_PATH):
+    return frozenset(url for url, result in load_health(path).items() if result["state"] == "dead")
+
+
+def health_report(resources, results):
+    """One row per resource with its last result, dead links first, then failing and blocked ones."""
+    order = {"dead": 0, "failing": 1, "blocked": 2, "ok": 3, "unchecked": 4}
+    rows = []
+    for resource in resources:
+        result = results.get(resource.url, {})
+        checked_at = result.get("checked_at")
+        rows.append({
+            "state": result.get("state", "unchecked"),
+            "name": resource.name,
+            "url": resource.url,
+            "status": result.get("status"),
+            "error": result.get("error"),
+            "checked": time.strftime("%Y-%m-%d %H:%M", time.localtime(checked_at)) if checked_at else None,
+        })
+    return sorted(rows, key=lambda row: order[row["state"]])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("urls", nargs="*", help="URLs to check (default: every link in the resource catalog)")
+    parser.add_argument("--path", default=LINK_HEALTH_PATH, help="results file (default: %(default)s)")
+    parser.add_argument("--ttl", type=float, default=TTL, help="seconds a result is reused (default: %(default)s)")
+    parser.add_argument("--concurrency", type=int, default=8, help="requests in flight (default: %(default)s)")
+    parser.add_argument("--host-interval", type=float, default=1.0,
+                        help="seconds between requests to one host (default: %(default)s)")
+    parser.add_argument("--force", action="store_true", help="check every link, however recent its result")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    results, checked = run_check(args.urls or None, path=args.path, ttl=args.ttl, concurrency=args.concurrency,
+                                 host_interval=args.host_interval, force=args.force)
+    counts = defaultdict(int)
+    for result in results.values():
+        counts[result["state"]] += 1
+    print(f"Checked {len(checked)} of {len(results)} links in {time.perf_counter() - started:.1f}s: "
+          + ", ".join(f"{count} {state}" for state, count in sorted(counts.items())))
+    for url, result in sorted(results.items()):
+        if result["state"] != "ok":
+            print(f"  {result['state']:8} {result['status'] or result['error']}  {url}")
+    raise SystemExit(1 if counts["dead"] else 0)
@@ -0,0 +1,135 @@
+"""Headless load test: a class of simulated students working through the app.
+
+``python loadtest.py --students 40`` opens 40 sessions in one process, with
+Streamlit's AppTest driving the real ``app.py``, and walks every student
+through the same steps: a few slides, the activity map, the settlement form
+and the resources page. The students take turns, one rerun each, so all of the
+sessions are alive at once and share the process's caches, as on a classroom
+server. (AppTest can't run two scripts in one process at the same time, and a
+single Streamlit process executes reruns mostly one at a time anyway.)
+
+It reports the rerun latency of each step and the memory each extra session
+costs. Set ``PIONEER_CLASSROOM=1`` to measure the classroom deployment mode.
+"""
+import argparse
+import gc
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+APP = str(Path(__file__).parent / "app.py")
+
+
+def goto(page):
+    return lambda at: at.sidebar.radio[0].set_value(page)
+
+
+def click(label):
+    return lambda at: next(button for button in at.button if button.label == label).click()
+
+
+def set_widget(kind, key, value):
+    def step(at):
+        widget = getattr(at, kind)(key=key)
+        if kind in ("text_input", "text_area"):
+            return widget.input(value)
+        if kind == "checkbox":
+            return widget.check()
+        return widget.set_value(value)
+    return step
+
+
+# (step name, action applied before the rerun); the first step is the initial page load
+STUDENT_STEPS = [
+    ("open app", None),
+    ("next slide", click("Next Slide ➡️")),
+    ("next slide", click("Next Slide ➡️")),
+    ("open activity", goto("🗺️ Student Activity")),
+    ("move latitude", set_widget("slider", "latitude", 42.9)),
+    ("move longitude", set_widget("slider", "longitude", -85.6)),
+    ("type name", set_widget("text_input", "student_name", "Student")),
+    ("type settlement", set_widget("text_input", "settlement_name", "Riverbend")),
+    ("choose region", set_widget("selectbox", "region", "Grand River Valley")),
+    ("tick priority", set_widget("checkbox", "water_access", True)),
+    ("write answer", set_widget("text_area", "vision", "A mill town on the Grand River.")),
+    ("submit plan", click("📝 Submit Your Settlement Plan")),
+    ("open resources", goto("📖 Resources & Library")),
+]
+
+
+def new_session():
+    from streamlit.testing.v1 import AppTest
+
+    return AppTest.from_file(APP, default_timeout=120)
+
+
+def rerun(at, action=None):
+    """Apply ``action`` to a session and rerun it; returns the latency in milliseconds."""
+    if action is not None:
+        action(at)
+    start = time.perf_counter()
+    at.run()
+    elapsed = (time.perf_counter() - start) * 1000
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return elapsed
+
+
+def run_class(students, steps=STUDENT_STEPS):
+    """Walk ``students`` sessions through ``steps`` in turns; returns (sessions, {step: [ms]})."""
+    sessions = [new_session() for _ in range(students)]
+    timings = {}
+    for name, action in steps:
+        for at in sessions:
+            timings.setdefault(name, []).append(rerun(at, action))
+    return sessions, timings
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q / 100))]
+
+
+def print_timings(timings):
+    print(f"{'step':<20} {'reruns':>6} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}")
+    for name, values in timings.items():
+        print(f"{name:<20} {len(values):6d} {statistics.median(values):9.1f} "
+              f"{percentile(values, 95):9.1f} {max(values):9.1f}")
+
+
+def session_memory(students):
+    """Python memory (KiB) held per extra session after a full walk-through, caches already warm."""
+    run_class(1)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    sessions, _ = run_class(students)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del sessions
+    return (after - before) / students / 1024
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--students", type=int, default=30)
+    parser.add_argument("--memory-students", type=int, default=10,
+                        help="sessions to average the per-session memory over")
+    args = parser.parse_args()
+
+    # Keep test plans out of the real database
+    os.environ.setdefault("PIONEER_DB_PATH", os.path.join(tempfile.mkdtemp(), "loadtest.db"))
+    from deployment import CLASSROOM
+
+    print(f"{args.students} students, classroom mode {'on' if CLASSROOM else 'off'}")
+    start = time.perf_counter()
+    _, timings = run_class(args.students)
+    elapsed = time.perf_counter() - start
+    print_timings(timings)
+    reruns = sum(len(values) for values in timings.values())
+    print(f"{reruns} reruns in {elapsed:.1f} s ({reruns / elapsed:.1f} reruns/s)")
+    print(f"memory per session: {session_memory(args.memory_students):.0f} KiB")
@@ -0,0 +1,274 @@
+import plotly.graph_objects as go
+
+from datasets import load_dataset
+from geometry import layer, lod_for_view, trace_xy
+
+# Bump whenever the map drawing changes so cached base maps are rebuilt (edits to
+# data/places.csv are picked up automatically; edits to data/geo/ need a restart)
+MAP_DATA_VERSION = 2
+
+# Nominal on-screen width of the activity map, used to pick its level of detail
+MAP_WIDTH_PX = 800
+LON_SPAN = (-87.5, -82)
+
+# The activity map shows the territory as it stood in this year
+MAP_YEAR = 1825
+
+# Years covered by the history (time slider) map
+TIMELINE_YEARS = range(1815, 1841)
+
+# Where each slide 6 region's settler counts are labelled on the history map
+REGION_LABEL_POSITIONS = {
+    "Detroit Area": (42.55, -83.0),
+    "Grand River Valley": (43.2, -85.4),
+    "Saginaw Valley": (43.75, -84.2),
+    "Lake Michigan Coast": (43.9, -86.1),
+    "Ann Arbor Area": (42.05, -83.85),
+}
+
+
+def settlements(year=MAP_YEAR):
+    """Return the settlements (``data/places.csv``) founded by ``year``."""
+    places = load_dataset("places")
+    return places[places["founded"] <= year]
+
+
+def default_lod():
+    """Level of detail for the full-territory view at the map's on-screen width."""
+    return lod_for_view(LON_SPAN[1] - LON_SPAN[0], MAP_WIDTH_PX)
+
+
+def territory_trace(lod):
+    # Michigan outline (both peninsulas in one trace)
+    outline_x, outline_y = trace_xy([part for _, parts in layer("territory", lod) for part in parts])
+    return go.Scatter(
+        x=outline_x,
+        y=outline_y,
+        fill="toself",
+        fillcolor="lightgreen",
+        line=dict(color="darkgreen", width=2),
+        name="Michigan Territory",
+        hoverinfo="name"
+    )
+
+
+def settlements_trace(places):
+    return go.Scatter(
+        x=places['lon'],
+        y=places['lat'],
+        mode='markers+text',
+        marker=dict(size=places['size'], color='red', symbol='star'),
+        text=places['name'],
+        textposition="top center",
+        name="Settlements",
+        hovertemplate='<b>%{text}</b><br>Existing settlement<extra></extra>'
+    )
+
+
+def river_traces(lod):
+    for river, parts in layer("rivers", lod):
+        river_x, river_y = trace_xy(parts)
+        yield go.Scatter(
+            x=river_x,
+            y=river_y,
+            mode='lines',
+            line=dict(color='blue', width=3),
+            name=river["name"],
+            hovertemplate=f'<b>{river["name"]}</b><extra></extra>'
+        )
+
+
+def lake_trace(lod):
+    lake_x, lake_y = trace_xy([part for _, parts in layer("lake_michigan", lod) for part in parts])
+    return go.Scatter(
+        x=lake_x,
+        y=lake_y,
+        fill="toself",
+        fillcolor="rgba(173, 216, 230, 0.3)",
+        line=dict(color="blue", width=1, dash='dash'),
+        name="Lake Michigan Coast",
+        hovertemplate='Lake Michigan Shoreline<br>Good for: Fruit orchards, Trade<extra></extra>'
+    )
+
+
+def swamp_traces(lod):
+    for swamp, parts in layer("swamps", lod):
+        swamp_x, swamp_y = trace_xy(parts)
+        yield go.Scatter(
+            x=swamp_x,
+            y=swamp_y,
+            fill="toself",
+            fillcolor="rgba(139, 69, 19, 0.2)",
+            line=dict(color="brown", width=1, dash='dot'),
+            name=swamp["name"],
+            hovertemplate=f'<b>{swamp["name"]}</b><br>Surveyor Report: "Uninhabitable"<br>Reality: Rich soil when drained<extra></extra>'
+        )
+
+
+MAP_LAYOUT = dict(
+    showlegend=True,
+    legend=dict(x=0, y=1),
+    height=600,
+    xaxis=dict(title="Longitude", range=list(LON_SPAN)),
+    yaxis=dict(title="Latitude", range=[41.5, 46.5], scaleanchor="x", scaleratio=1),
+    hovermode='closest',
+    plot_bgcolor='lightblue',
+    paper_bgcolor='white'
+)
+
+
+def build_base_map(lod=None):
+    """Build the static 1825 territory map shared by every student session.
+
+    Geometry is drawn at level of detail ``lod``, by default the one that
+    suits the map's full-territory view. The returned figure is cached
+    process-wide, so callers must treat it as read-only.
+    """
+    lod = lod or default_lod()
+    fig = go.Figure()
+    fig.add_trace(territory_trace(lod))
+    fig.add_trace(settlements_trace(settlements()))
+    fig.add_traces(list(river_traces(lod)))
+    fig.add_trace(lake_trace(lod))
+    fig.add_traces(list(swamp_traces(lod)))
+    fig.update_layout(**MAP_LAYOUT)
+    return fig
+
+
+def timeline_traces(year, roads, regions):
+    """The traces of the history map that change with ``year``: routes, settlements and region counts."""
+    traces = []
+    for road, parts in roads:
+        opened = road["year"] <= year
+        road_x, road_y = trace_xy(parts) if opened else ([], [])
+        traces.append(go.Scatter(
+            x=road_x,
+            y=road_y,
+            mode='lines',
+            line=dict(color='saddlebrown' if road["kind"] == "road" else 'navy', width=3,
+                      dash='solid' if road["kind"] == "road" else 'dash'),
+            name=f'{road["name"]} ({road["year"]})',
+            hovertemplate=f'<b>{road["name"]}</b><br>{road["description"]}<extra></extra>'
+        ))
+    traces.append(settlements_trace(settlements(year)))
+    # Slide 6 only has early counts and counts for 1837, so the labels switch over in 1837
+    counts = regions["By 1837"] if year >= 1837 else regions["Early Settlers"]
+    positions = [REGION_LABEL_POSITIONS[region] for region in regions["Region"]]
+    traces.append(go.Scatter(
+        x=[lon for _, lon in positions],
+        y=[lat for lat, _ in positions],
+        mode='text',
+        text=[f"{count:,} settlers" for count in counts],
+        textfont=dict(size=12, color='black'),
+        name="Settlers by region (1837)" if year >= 1837 else "Settlers by region (early)",
+        hovertext=list(regions["Region"]),
+        hoverinfo="text"
+    ))
+    return traces
+
+
+def timeline_title(year, population):
+    """Frame title: the most recent population figure known in ``year``."""
+    known = population[population["Year"].astype(int) <= year]
+    if known.empty:
+        return f"Michigan Territory in {year}"
+    last = known.iloc[-1]
+    return f"Michigan Territory in {year}: population {last['Population']:,} ({last['Year']})"
+
+
+def build_timeline_map(lod=None):
+    """Build the 1815-1840 history map, with one animation frame per year.
+
+    The fixed geography is drawn once; each frame only replaces the routes,
+    settlements and region labels, and the year slider and play button run
+    in the browser, so moving through the years never reruns the app.
+    """
+    lod = lod or default_lod()
+    roads = layer("roads", lod)
+    regions = load_dataset("regional_settlement")
+    population = load_dataset("population_timeline")
+
+    fig = go.Figure()
+    fig.add_trace(territory_trace(lod))
+    fig.add_traces(list(river_traces(lod)))
+    fig.add_trace(lake_trace(lod))
+    fig.add_traces(list(swamp_traces(lod)))
+    first_dynamic = len(fig.data)
+
+    first_year = TIMELINE_YEARS[0]
+    fig.add_traces(timeline_traces(first_year, roads, regions))
+    dynamic = list(range(first_dynamic, len(fig.data)))
+    fig.frames = [
+        go.Frame(
+            name=str(year),
+            data=timeline_traces(year, roads, regions),
+            traces=dynamic,
+            layout=dict(title=dict(text=timeline_title(year, population)))
+        )
+        for year in TIMELINE_YEARS
+    ]
+
+    frame_args = dict(frame=dict(duration=600, redraw=True), transition=dict(duration=0), mode="immediate")
+    fig.update_layout(**MAP_LAYOUT)
+    fig.update_layout(
+        title=dict(text=timeline_title(first_year, population)),
+        height=700,
+        updatemenus=[dict(
+            type="buttons", x=0, y=-0.08, xanchor="left", showactive=False,
+            buttons=[dict(label="▶ Play", method="animate", args=[None, dict(frame_args, fromcurrent=True)]),
+                     dict(label="⏸ Pause", method="animate", args=[[None], dict(frame_args, frame=dict(duration=0))])],
+        )],
+        sliders=[dict(
+            active=0, x=0.12, y=-0.02, len=0.88, currentvalue=dict(prefix="Year: "),
+            steps=[dict(label=str(year), method="animate", args=[[str(year)], frame_args])
+                   for year in TIMELINE_YEARS],
+        )],
+    )
+    return fig
+
+
+def with_overlays(base_map):
+    """Return a private copy of ``base_map`` with empty per-session overlay traces.
+
+    The copy is made once per session and carries two overlays: the class
+    settlement heatmap and, on top, the preview pin. Afterwards
+    ``set_class_heatmap`` and ``move_preview_pin`` only patch those traces
+    instead of rebuilding or re-copying the map.
+    """
+    fig = go.Figure(base_map)
+    fig.add_trace(go.Heatmap(
+        x=[],
+        y=[],
+        z=[],
+        colorscale="YlOrRd",
+        opacity=0.7,
+        showscale=False,
+        visible=False,
+        name="Class Settlements",
+        hovertemplate='%{z} plans near %{y:.1f}°N, %{x:.1f}°W<extra></extra>'
+    ))
+    fig.add_trace(go.Scatter(
+        x=[],
+        y=[],
+        mode='markers',
+        marker=dict(size=16, color='orange', symbol='circle', line=dict(color='black', width=2)),
+        name="Your Settlement (preview)",
+        hovertemplate='<b>Your proposed settlement</b><br>%{y:.1f}°N, %{x:.1f}°W<extra></extra>'
+    ))
+    return fig
+
+
+def move_preview_pin(fig, latitude, longitude):
+    """Move the preview pin added by ``with_overlays`` to the given coordinates."""
+    fig.data[-1].update(x=[longitude], y=[latitude])
+    return fig
+
+
+def set_class_heatmap(fig, grid):
+    """Show ``grid`` (a ``heatmap.SettlementGrid``) as the class heatmap, or hide it if ``None``."""
+    if grid is None:
+        fig.data[-2].visible = False
+    else:
+        x, y, z = grid.trace_data()
+        fig.data[-2].update(x=x, y=y, z=z, visible=True)
+    return fig
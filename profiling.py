@@ -0,0 +1,165 @@
+"""Per-rerun timing instrumentation.
+
+A single ``Profiler`` per process collects how long each page, slide and
+section takes to render, how many reruns each session makes and how large the
+figures sent to the browser are. Aggregates (p50/p95) are shown in the
+instructor sidebar panel, and every profiled rerun is appended as one JSON line
+to ``PIONEER_PROFILE_LOG``; lines are buffered and written in batches, outside
+the lock the sessions share. Profiling is off unless ``PIONEER_PROFILE=1`` is
+set or it is switched on from the panel; when off, sections cost one
+attribute check and nothing is counted.
+"""
+import atexit
+import json
+import os
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from contextlib import contextmanager
+
+PROFILE_LOG = os.environ.get("PIONEER_PROFILE_LOG", "profile_log.jsonl")
+ENABLED = os.environ.get("PIONEER_PROFILE", "").lower() in ("1", "true", "yes")
+
+# Log lines buffered before they are written, and the longest a line waits (seconds)
+LOG_BATCH = 50
+LOG_INTERVAL = 5.0
+
+
+def percentile(values, q):
+    """Linearly interpolated ``q``-th percentile (0-100) of a non-empty sequence."""
+    values = sorted(values)
+    position = (len(values) - 1) * q / 100
+    low = int(position)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (position - low)
+
+
+class Profiler:
+    """Process-wide store of recent timings and payload sizes."""
+
+    def __init__(self, log_path=PROFILE_LOG, enabled=ENABLED, max_samples=2000, max_sessions=1000):
+        self.log_path = log_path
+        self.enabled = enabled
+        # Profiled reruns per session, for the most recently active ``max_sessions`` sessions
+        self.reruns = Counter()
+        self.max_sessions = max_sessions
+        self._timings = defaultdict(lambda: deque(maxlen=max_samples))
+        self._payloads = defaultdict(lambda: deque(maxlen=max_samples))
+        self._lock = threading.Lock()
+        self._pending = []
+        self._flushed_at = time.monotonic()
+        self._log_lock = threading.Lock()
+        atexit.register(self.flush_log)
+
+    def start_run(self, session_id, page):
+        """Begin profiling one script run; returns a ``RunProfile``."""
+        run_number = None
+        if self.enabled:
+            with self._lock:
+                # Re-insert the session so the least recently active one is dropped first
+                run_number = self.reruns.pop(session_id, 0) + 1
+                self.reruns[session_id] = run_number
+                if len(self.reruns) > self.max_sessions:
+                    del self.reruns[next(iter(self.reruns))]
+        return RunProfile(self, session_id, page, run_number)
+
+    def _finish(self, run):
+        with self._lock:
+            for name, ms in run.sections.items():
+                self._timings[name].append(ms)
+            for name, size in run.payloads.items():
+                self._payloads[name].append(size)
+            if not self.log_path:
+                return
+            self._pending.append(json.dumps(run.as_record()) + "\n")
+            due = len(self._pending) >= LOG_BATCH or time.monotonic() - self._flushed_at >= LOG_INTERVAL
+        if due:
+            self.flush_log()
+
+    def flush_log(self):
+        """Append the buffered log lines to the log file."""
+        with self._lock:
+            lines, self._pending = self._pending, []
+            self._flushed_at = time.monotonic()
+        if lines and self.log_path:
+            # Only writers wait on the file; sessions starting or summarizing runs don't
+            with self._log_lock, open(self.log_path, "a", encoding="utf-8") as log:
+                log.writelines(lines)
+
+    def summary(self):
+        """Return one row per section: sample count and p50/p95/max in milliseconds."""
+        with self._lock:
+            timings = {name: list(samples) for name, samples in self._timings.items()}
+        return [
+            {"section": name, "runs": len(samples),
+             "p50 ms": round(percentile(samples, 50), 2),
+             "p95 ms": round(percentile(samples, 95), 2),
+             "max ms": round(max(samples), 2)}
+            for name, samples in sorted(timings.items())
+        ]
+
+    def payload_summary(self):
+        """Return the median and largest size, in KiB, of each recorded figure."""
+        with self._lock:
+            payloads = {name: list(sizes) for name, sizes in self._payloads.items()}
+        return [
+            {"figure": name, "p50 KiB": round(percentile(sizes, 50) / 1024, 1),
+             "max KiB": round(max(sizes) / 1024, 1)}
+            for name, sizes in sorted(payloads.items())
+        ]
+
+    def reset(self):
+        self.flush_log()
+        with self._lock:
+            self._timings.clear()
+            self._payloads.clear()
+            self.reruns.clear()
+
+
+class RunProfile:
+    """Timings for a single script run."""
+
+    def __init__(self, profiler, session_id, page, run_number):
+        self.profiler = profiler
+        self.session_id = session_id
+        self.page = page
+        self.run_number = run_number
+        self.sections = {}
+        self.payloads = {}
+        self.started = time.perf_counter()
+
+    @contextmanager
+    def section(self, name):
+        """Time the enclosed block as ``name``."""
+        if not self.profiler.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.sections[name] = (time.perf_counter() - start) * 1000
+
+    def payload(self, name, fig):
+        """Record the serialized size of a figure about to be sent to the browser."""
+        if self.profiler.enabled:
+            import plotly.io as pio
+
+            self.payloads[name] = len(pio.to_json(fig, validate=False))
+
+    def finish(self):
+        """Record the whole rerun under its page and hand the run to the profiler."""
+        if not self.profiler.enabled:
+            return
+        self.sections[f"rerun: {self.page}"] = (time.perf_counter() - self.started) * 1000
+        self.profiler._finish(self)
+
+    def as_record(self):
+        return {
+            "time": time.time(),
+            "session": self.session_id,
+            "run": self.run_number,
+            "page": self.page,
+            "sections_ms": {name: round(ms, 3) for name, ms in self.sections.items()},
+            "payload_bytes": self.payloads,
+        }
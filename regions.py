@@ -0,0 +1,85 @@
+"""Which of the settlement form's regions a point on the map falls in.
+
+The regions are polygons in ``data/geo/regions.geojson``, named exactly as in
+the form's region selectbox. ``RegionGrid`` runs the point-in-polygon tests
+once for every cell of a grid over the map, so classifying a point afterwards
+is one array lookup, for a single pin or every stored plan at once.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from geometry import layer
+from heatmap import LAT_RANGE, LON_RANGE
+from scoring import INDEX_CELL_SIZE, inside, polyline_segments, project
+
+REGION_NAMES = tuple(properties["name"] for properties, _ in layer("regions"))
+
+# Grid value for points outside every region (e.g. the Upper Peninsula)
+NO_REGION = len(REGION_NAMES)
+
+
+class RegionGrid:
+    """Index of the region containing each grid cell centre."""
+
+    def __init__(self, lon_range=LON_RANGE, lat_range=LAT_RANGE, cell_size=INDEX_CELL_SIZE):
+        self.lon0, self.lat0, self.cell_size = lon_range[0], lat_range[0], cell_size
+        lons = np.arange(lon_range[0], lon_range[1] + cell_size / 2, cell_size)
+        lats = np.arange(lat_range[0], lat_range[1] + cell_size / 2, cell_size)
+        grid_lat, grid_lon = np.meshgrid(lats, lons, indexing="ij")
+        # Slider positions often land exactly on region edges; nudging every test point
+        # north-east by a hair puts them consistently in one region instead of none or two
+        x, y = project(grid_lat.ravel() + 1e-6, grid_lon.ravel() + 1e-6)
+        cells = np.full(x.shape, NO_REGION, dtype=np.uint8)
+        for number, (_, parts) in enumerate(layer("regions")):
+            segments = np.vstack([polyline_segments(part) for part in parts])
+            cells[inside(x, y, segments)] = number
+        self.cells = cells.reshape(grid_lat.shape)
+
+    def classify(self, latitudes, longitudes):
+        """Return the region number (``NO_REGION`` if none) of each coordinate."""
+        rows = np.rint((np.asarray(latitudes, dtype=float) - self.lat0) / self.cell_size).astype(int)
+        cols = np.rint((np.asarray(longitudes, dtype=float) - self.lon0) / self.cell_size).astype(int)
+        on_grid = (rows >= 0) & (rows < self.cells.shape[0]) & (cols >= 0) & (cols < self.cells.shape[1])
+        result = np.full(rows.shape, NO_REGION, dtype=np.uint8)
+        result[on_grid] = self.cells[rows[on_grid], cols[on_grid]]
+        return result
+
+
+@lru_cache(maxsize=1)
+def get_region_grid():
+    """Return the process-wide ``RegionGrid``."""
+    return RegionGrid()
+
+
+def region_at(latitude, longitude):
+    """Return the name of the region containing a point, or ``None``."""
+    number = get_region_grid().classify([latitude], [longitude])[0]
+    return REGION_NAMES[number] if number != NO_REGION else None
+
+
+def consistency_report(store, **filters):
+    """Compare each stored plan's chosen region with the one its coordinates fall in.
+
+    Returns ``(checked, mismatches)``: the number of plans with a region and a
+    list of ``{id, student_name, settlement_name, chosen, located}`` for the
+    plans whose pin is somewhere else.
+    """
+    grid = get_region_grid()
+    checked = 0
+    mismatches = []
+    for batch in store.iter_plans(**filters):
+        located = grid.classify([plan["latitude"] for plan in batch], [plan["longitude"] for plan in batch])
+        for plan, number in zip(batch, located):
+            if plan["region"] not in REGION_NAMES:
+                continue
+            checked += 1
+            if number == NO_REGION or REGION_NAMES[number] != plan["region"]:
+                mismatches.append({
+                    "id": plan["id"],
+                    "student_name": plan["student_name"],
+                    "settlement_name": plan["settlement_name"],
+                    "chosen": plan["region"],
+                    "located": REGION_NAMES[number] if number != NO_REGION else "(no region)",
+                })
+    return checked, mismatches
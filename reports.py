@@ -0,0 +1,196 @@
+"""Settlement plan reports in Markdown, plain text, HTML and PDF.
+
+Every format is rendered from the same plan record. The templates are compiled
+once at import, and ``render_batch`` reuses them for a whole class at a time.
+The PDF uses the standard Helvetica font with Western European (cp1252)
+characters only; text in other scripts, such as Arabic or Chinese, prints as
+``?`` there, while the Markdown, text and HTML reports keep it.
+"""
+import html
+from string import Template
+
+# Priority checkboxes on the settlement form: (plan key, checkbox label, report label)
+PRIORITY_OPTIONS = [
+    ("water_access", "Water access (river/lake)", "Water access"),
+    ("fertile_soil", "Potential fertile soil", "Fertile soil"),
+    ("timber", "Abundant timber", "Timber"),
+    ("trade_routes", "Near trade routes", "Trade routes"),
+    ("existing_settlements", "Near existing settlements", "Near settlements"),
+    ("defense", "Defensible location", "Defense"),
+    ("native_relations", "Good Native American relations", "Native relations"),
+    ("ignore_reports", "Ignoring negative reports", "Ignoring negative reports"),
+]
+
+TEMPLATES = {
+    # Markdown needs two trailing spaces for a line break
+    "markdown": Template(
+        "**Pioneer:** $student_name  \n"
+        "**Settlement:** $settlement_name  \n"
+        "**Location:** $region  \n"
+        "**Coordinates:** $latitude°N, $longitude°W\n"
+        "\n"
+        "**Key Priorities:**\n"
+        "\n"
+        "$priorities\n"
+    ),
+    "text": Template("""
+MICHIGAN PIONEER SETTLEMENT PLAN
+================================
+
+Student: $student_name
+Settlement Name: $settlement_name
+Region: $region
+Location: $latitude°N, $longitude°W
+
+PRIORITIES:
+$priorities
+
+EXPECTED CHALLENGES:
+$challenges
+
+AVAILABLE RESOURCES:
+$resources
+
+20-YEAR VISION:
+$vision
+
+FIRST YEAR STRATEGY:
+$strategy
+"""),
+    "html": Template("""\
+<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>Settlement Plan: $settlement_name</title></head>
+<body>
+<h1>Michigan Pioneer Settlement Plan</h1>
+<p><strong>Student:</strong> $student_name<br>
+<strong>Settlement Name:</strong> $settlement_name<br>
+<strong>Region:</strong> $region<br>
+<strong>Location:</strong> $latitude°N, $longitude°W</p>
+<h2>Priorities</h2>
+<ul>$priorities</ul>
+<h2>Expected Challenges</h2>
+<p>$challenges</p>
+<h2>Available Resources</h2>
+<p>$resources</p>
+<h2>20-Year Vision</h2>
+<p>$vision</p>
+<h2>First Year Strategy</h2>
+<p>$strategy</p>
+</body>
+</html>
+"""),
+}
+
+FORMATS = {
+    "markdown": ("md", "text/markdown"),
+    "text": ("txt", "text/plain"),
+    "html": ("html", "text/html"),
+    "pdf": ("pdf", "application/pdf"),
+}
+
+TEXT_FIELDS = ["student_name", "settlement_name", "region", "challenges", "resources", "vision", "strategy"]
+
+
+def plan_priorities(form_values):
+    """Return report labels for the priority checkboxes ticked in ``form_values``."""
+    return [label for key, _, label in PRIORITY_OPTIONS if form_values.get(key)]
+
+
+def _fields(plan, fmt):
+    fields = {field: plan[field] for field in TEXT_FIELDS}
+    fields["latitude"] = plan["latitude"]
+    fields["longitude"] = plan["longitude"]
+    priorities = plan["priorities"]
+    if fmt == "html":
+        fields = {field: html.escape(str(value)).replace("\n", "<br>\n") for field, value in fields.items()}
+        fields["priorities"] = "".join(f"<li>{html.escape(p)}</li>" for p in priorities)
+    else:
+        fields["priorities"] = "\n".join("- " + p for p in priorities)
+    return fields
+
+
+def render(plan, fmt="text"):
+    """Render one plan; returns ``str`` for text formats and ``bytes`` for PDF."""
+    if fmt == "pdf":
+        return text_to_pdf(render(plan, "text"))
+    return TEMPLATES[fmt].substitute(_fields(plan, fmt))
+
+
+def render_batch(plans, fmt="text"):
+    """Render a batch of plans with the shared compiled template."""
+    if fmt == "pdf":
+        return [text_to_pdf(text) for text in render_batch(plans, "text")]
+    template = TEMPLATES[fmt]
+    return [template.substitute(_fields(plan, fmt)) for plan in plans]
+
+
+# ==================== PDF ====================
+# A tiny single-font PDF writer, enough for plain-text reports without
+# pulling in a PDF library. No font is embedded, so only cp1252 characters
+# can be shown; anything else is replaced with "?".
+
+PDF_CHARSET_NOTE = ("The PDF shows Western European characters only; text in other scripts prints as ?. "
+                    "Download the TXT or HTML report to keep it.")
+
+PDF_PAGE_WIDTH, PDF_PAGE_HEIGHT = 612, 792  # US Letter, in points
+PDF_MARGIN = 54
+PDF_FONT_SIZE = 11
+PDF_LEADING = 14
+PDF_WRAP = 90  # characters per line at 11pt Helvetica inside the margins
+
+
+def _wrap(text, width=PDF_WRAP):
+    lines = []
+    for line in text.split("\n"):
+        while len(line) > width:
+            cut = line.rfind(" ", 0, width)
+            cut = cut if cut > 0 else width
+            lines.append(line[:cut])
+            line = line[cut:].lstrip()
+        lines.append(line)
+    return lines
+
+
+def _pdf_string(line):
+    escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+    return escaped.encode("cp1252", errors="replace")
+
+
+def text_to_pdf(text):
+    """Lay ``text`` out as wrapped lines of 11pt Helvetica and return the PDF bytes.
+
+    Characters outside cp1252 are replaced with ``?`` (see ``PDF_CHARSET_NOTE``).
+    """
+    lines = _wrap(text.strip("\n"))
+    per_page = (PDF_PAGE_HEIGHT - 2 * PDF_MARGIN) // PDF_LEADING
+    pages = [lines[i:i + per_page] for i in range(0, len(lines), per_page)] or [[]]
+
+    # Objects: 1 catalog, 2 page tree, 3 font, then a page + content stream per page
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    page_ids = []
+    for page_lines in pages:
+        stream = b"BT /F1 %d Tf %d TL %d %d Td " % (
+            PDF_FONT_SIZE, PDF_LEADING, PDF_MARGIN, PDF_PAGE_HEIGHT - PDF_MARGIN)
+        stream += b"".join(b"(" + _pdf_string(line) + b") Tj T* " for line in page_lines) + b"ET"
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] /Resources << /Font << /F1 3 0 R >> >> "
+                       b"/Contents %d 0 R >>" % (PDF_PAGE_WIDTH, PDF_PAGE_HEIGHT, len(objects)))
+        page_ids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % page_id for page_id in page_ids), len(page_ids))
+
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return pdf
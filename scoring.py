@@ -0,0 +1,179 @@
+"""Site scores for settlement plans, measured against the 1825 map geography.
+
+A proposed site is rated on four criteria: distance to water (rivers and the
+Great Lakes shoreline), to the existing settlements, to the Detroit market, and
+how clear it is of the swamps. Exact distances are computed with vectorized
+point-to-segment math, but only once: ``GeoIndex`` evaluates them at the
+centre of every cell of a fine grid over the map, so scoring any number of
+plans is a single array lookup per criterion. Plans come from 0.1° sliders, so
+the 0.02° cells (about 2 km) cost no meaningful accuracy.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from datasets import dataset_token
+from geometry import layer
+from heatmap import LAT_RANGE, LON_RANGE
+from michigan_map import settlements
+from reports import PRIORITY_OPTIONS
+
+INDEX_CELL_SIZE = 0.02
+
+# Kilometres per degree, for an equirectangular projection centred on the territory
+KM_PER_DEG_LAT = 110.6
+KM_PER_DEG_LON = 111.3 * np.cos(np.radians(44.0))
+
+DETROIT = (42.33, -83.05)
+
+# Criterion → (weight, distance scoring full points, distance scoring nothing); weights sum to 100
+CRITERIA = {
+    "water": (35, 5.0, 40.0),
+    "neighbors": (25, 20.0, 150.0),
+    "market": (20, 30.0, 250.0),
+    "drainage": (20, 15.0, 0.0),
+}
+
+# Form priority → the criterion that checks it
+PRIORITY_CRITERIA = {
+    "water_access": "water",
+    "existing_settlements": "neighbors",
+    "trade_routes": "market",
+}
+
+# Points per chunk when computing exact distances, to bound the (points × segments) arrays
+CHUNK_SIZE = 4096
+
+
+def project(latitudes, longitudes):
+    """Return ``(x, y)`` in kilometres for arrays of coordinates."""
+    return (np.asarray(longitudes, dtype=float) * KM_PER_DEG_LON,
+            np.asarray(latitudes, dtype=float) * KM_PER_DEG_LAT)
+
+
+def polyline_segments(points):
+    """Return the ``(S, 4)`` array of projected ``x0, y0, x1, y1`` segments along lon/lat ``points``."""
+    x, y = project(points[:, 1], points[:, 0])
+    return np.column_stack([x[:-1], y[:-1], x[1:], y[1:]])
+
+
+def layer_segments(name, shoreline_only=False):
+    """Stack the segments of every part of a geometry layer.
+
+    With ``shoreline_only``, the leading ``border_vertices`` of each ring (the
+    land borders with Indiana and Ohio) are skipped.
+    """
+    segments = []
+    for properties, parts in layer(name):
+        skip = max(properties.get("border_vertices", 0) - 1, 0) if shoreline_only else 0
+        segments.extend(polyline_segments(part[skip:]) for part in parts)
+    return np.vstack(segments)
+
+
+def segment_distances(x, y, segments):
+    """Distance from each point to the nearest of ``segments``, in kilometres."""
+    x0, y0, x1, y1 = (segments[:, i] for i in range(4))
+    dx, dy = x1 - x0, y1 - y0
+    length_sq = np.where(dx * dx + dy * dy > 0, dx * dx + dy * dy, 1.0)
+    nearest = np.empty(len(x))
+    for start in range(0, len(x), CHUNK_SIZE):
+        px = x[start:start + CHUNK_SIZE, None]
+        py = y[start:start + CHUNK_SIZE, None]
+        t = np.clip(((px - x0) * dx + (py - y0) * dy) / length_sq, 0.0, 1.0)
+        nearest[start:start + CHUNK_SIZE] = np.hypot(px - (x0 + t * dx), py - (y0 + t * dy)).min(axis=1)
+    return nearest
+
+
+def inside(x, y, segments):
+    """Even-odd test of each point against the closed polygon given by its edge ``segments``."""
+    x0, y0, x1, y1 = (segments[:, i] for i in range(4))
+    result = np.zeros(len(x), dtype=bool)
+    for start in range(0, len(x), CHUNK_SIZE):
+        px = x[start:start + CHUNK_SIZE, None]
+        py = y[start:start + CHUNK_SIZE, None]
+        crosses = (y0 > py) != (y1 > py)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_cross = x0 + (py - y0) * (x1 - x0) / (y1 - y0)
+        result[start:start + CHUNK_SIZE] = (crosses & (px < x_cross)).sum(axis=1) % 2 == 1
+    return result
+
+
+class GeoIndex:
+    """Distance fields for every scoring criterion, precomputed on a regular grid."""
+
+    def __init__(self, lon_range=LON_RANGE, lat_range=LAT_RANGE, cell_size=INDEX_CELL_SIZE):
+        self.lon0, self.lat0, self.cell_size = lon_range[0], lat_range[0], cell_size
+        lons = np.arange(lon_range[0], lon_range[1] + cell_size / 2, cell_size)
+        lats = np.arange(lat_range[0], lat_range[1] + cell_size / 2, cell_size)
+        grid_lat, grid_lon = np.meshgrid(lats, lons, indexing="ij")
+        fields = self.exact(grid_lat.ravel(), grid_lon.ravel())
+        self.fields = {name: values.reshape(grid_lat.shape) for name, values in fields.items()}
+
+    @staticmethod
+    def exact(latitudes, longitudes):
+        """Compute every criterion's distance (km) and the land/swamp flags directly."""
+        x, y = project(latitudes, longitudes)
+        water = np.vstack([layer_segments("rivers"), layer_segments("territory", shoreline_only=True)])
+        swamps = layer_segments("swamps")
+        places = settlements()
+        town_x, town_y = project(places["lat"], places["lon"])
+        market_x, market_y = project(*DETROIT)
+
+        on_map = inside(x, y, layer_segments("territory"))
+        in_swamp = inside(x, y, swamps)
+        return {
+            # A site out in the lakes is on the water, whatever its distance to the shore
+            "water": np.where(on_map, segment_distances(x, y, water), 0.0),
+            "neighbors": np.hypot(x[:, None] - town_x, y[:, None] - town_y).min(axis=1),
+            "market": np.hypot(x - market_x, y - market_y),
+            "drainage": np.where(in_swamp, 0.0, segment_distances(x, y, swamps)),
+            "in_swamp": in_swamp,
+            "on_map": on_map,
+        }
+
+    def lookup(self, latitudes, longitudes):
+        """Return each field's value at the grid cell nearest to every coordinate."""
+        rows = np.rint((np.asarray(latitudes, dtype=float) - self.lat0) / self.cell_size).astype(int)
+        cols = np.rint((np.asarray(longitudes, dtype=float) - self.lon0) / self.cell_size).astype(int)
+        shape = next(iter(self.fields.values())).shape
+        rows = np.clip(rows, 0, shape[0] - 1)
+        cols = np.clip(cols, 0, shape[1] - 1)
+        return {name: values[rows, cols] for name, values in self.fields.items()}
+
+
+def get_index():
+    """Return the process-wide ``GeoIndex``, rebuilt when the settlements dataset changes."""
+    return _index(dataset_token("places"))
+
+
+@lru_cache(maxsize=1)
+def _index(places_token):
+    return GeoIndex()
+
+
+def score_sites(latitudes, longitudes, index=None):
+    """Score a batch of sites; returns arrays of distances, per-criterion points and ``total``."""
+    values = (index or get_index()).lookup(latitudes, longitudes)
+    total = np.zeros(len(values["water"]))
+    for name, (weight, full, zero) in CRITERIA.items():
+        points = weight * np.clip((zero - values[name]) / (zero - full), 0.0, 1.0)
+        # Swamp soil was rich once drained, so a site in one keeps a quarter of the drainage points
+        if name == "drainage":
+            points = np.where(values["in_swamp"], weight / 4, points)
+        values[f"{name}_points"] = points
+        total += points
+    # A settlement needs dry land
+    values["total"] = np.where(values["on_map"], total, 0.0)
+    return values
+
+
+def score_plan(plan):
+    """Score one plan; also lists the chosen priorities its site earns under half the points for."""
+    values = score_sites([plan["latitude"]], [plan["longitude"]])
+    score = {name: value[0].item() for name, value in values.items()}
+    criteria = {label: PRIORITY_CRITERIA[key] for key, _, label in PRIORITY_OPTIONS if key in PRIORITY_CRITERIA}
+    score["unmet_priorities"] = [
+        label for label in plan["priorities"]
+        if label in criteria and score[f"{criteria[label]}_points"] < CRITERIA[criteria[label]][0] / 2
+    ]
+    return score
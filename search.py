@@ -0,0 +1,210 @@
+"""Full-text search over the slides, the activity and resources page text and the link catalog.
+
+Every slide of every deck, every ``content`` section and every catalog link is
+one document. The index is built once per process (and again only if the
+catalog or a slide dataset changes): text is tokenized, stop words are dropped
+and the rest reduced to stems, and each term's posting list stores its
+precomputed BM25 weight per document, so a query is a few dictionary lookups
+and additions however many chapters exist.
+Results carry where they are shown, so the sidebar can jump straight to them.
+"""
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+
+import streamlit as st
+
+from catalog import get_catalog
+from content import ACTIVITY, RESOURCES, RESOURCES_TABS, Section
+from datasets import dataset_token, load_dataset
+from slides import Callout, Columns, DECKS, Image, Markdown, Table, load_deck, literal_table
+from views import PAGES
+
+# BM25 parameters, and how many times a title counts compared with body text
+K1 = 1.2
+B = 0.75
+TITLE_WEIGHT = 3
+
+STOP_WORDS = frozenset("""
+a about after all also an and any are as at be because been before but by can could did do does for from had
+has have how i if in into is it its just more most no not of on one only or other our out over so some such than
+that the their them then there these they this those through to up was we were what when where which who why
+will with would you your
+""".split())
+
+# Derivational suffixes stripped after plurals, longest first: (suffix, replacement, shortest stem kept)
+SUFFIXES = [
+    ("ational", "ate", 3), ("ization", "ize", 3), ("ation", "ate", 3), ("ement", "", 3), ("ment", "", 4),
+    ("ness", "", 3), ("ical", "", 3), ("ity", "", 3), ("ful", "", 3), ("age", "", 4), ("al", "", 4),
+    ("or", "", 4), ("ly", "", 3),
+]
+INFLECTIONS = ("ingly", "edly", "ing", "ed", "er")
+
+TOKEN = re.compile(r"[a-z0-9]+")
+MARKUP = re.compile(r"<[^>]+>|\]\([^)]*\)|[*_#>`|\[]")
+
+
+@lru_cache(maxsize=20000)
+def stem(word):
+    """Reduce ``word`` to a crude stem, e.g. settled, settlers and settlement all become ``settl``."""
+    if len(word) <= 3 or word.isdigit():
+        return word
+    if word.endswith("ies") and len(word) > 4:
+        word = word[:-3] + "y"
+    elif word.endswith("sses"):
+        word = word[:-2]
+    elif word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        word = word[:-1]
+    for suffix, replacement, shortest in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= shortest:
+            word = word[:-len(suffix)] + replacement
+            break
+    for suffix in INFLECTIONS:
+        base = word[:-len(suffix)]
+        if word.endswith(suffix) and len(base) >= 3 and any(vowel in base for vowel in "aeiouy"):
+            word = base[:-1] if base[-1] == base[-2] and base[-1] not in "lsz" else base
+            break
+    if len(word) > 4 and word[-1] in "ey":
+        word = word[:-1]
+    return word
+
+
+def plain_text(markdown):
+    """Markdown/HTML with the markup (and link targets) removed."""
+    return " ".join(MARKUP.sub(" ", markdown).split())
+
+
+def analyze(text):
+    """The index terms of ``text``: lowercase word stems, without stop words."""
+    return [stem(token) for token in TOKEN.findall(text.lower()) if token not in STOP_WORDS and len(token) > 1]
+
+
+@dataclass(frozen=True)
+class Document:
+    page: str
+    title: str
+    text: str
+    slide: tuple = None  # (deck id, slide number)
+    section: object = None  # a content.Section
+
+    @property
+    def label(self):
+        icon = self.page.split()[0]
+        if self.slide:
+            return f"{icon} Slide {self.slide[1]}: {self.title}"
+        return f"{icon} {self.title}"
+
+
+class SearchIndex:
+    """An inverted index with BM25 ranking."""
+
+    def __init__(self, documents):
+        self.documents = list(documents)
+        term_counts = []
+        for doc in self.documents:
+            counts = Counter(analyze(doc.text))
+            for term in analyze(doc.title):
+                counts[term] += TITLE_WEIGHT
+            term_counts.append(counts)
+
+        lengths = [sum(counts.values()) for counts in term_counts]
+        average = sum(lengths) / max(len(lengths), 1)
+        frequency = Counter(term for counts in term_counts for term in counts)
+        total = len(self.documents)
+
+        # term → [(document id, BM25 weight)]
+        self.postings = defaultdict(list)
+        for doc_id, (counts, length) in enumerate(zip(term_counts, lengths)):
+            norm = K1 * (1 - B + B * length / average)
+            for term, tf in counts.items():
+                idf = math.log(1 + (total - frequency[term] + 0.5) / (frequency[term] + 0.5))
+                self.postings[term].append((doc_id, idf * tf * (K1 + 1) / (tf + norm)))
+        self.postings = dict(self.postings)
+
+    def search(self, query, limit=5):
+        """Return up to ``limit`` (score, document) pairs for ``query``, best first."""
+        scores = defaultdict(float)
+        for term in set(analyze(query)):
+            for doc_id, weight in self.postings.get(term, ()):
+                scores[doc_id] += weight
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [(score, self.documents[doc_id]) for doc_id, score in best]
+
+    @staticmethod
+    def snippet(doc, query, width=140):
+        """A short excerpt of ``doc`` around the first word matching ``query``."""
+        terms = set(analyze(query))
+        for match in TOKEN.finditer(doc.text.lower()):
+            if stem(match.group()) in terms:
+                start = max(0, match.start() - width // 3)
+                excerpt = doc.text[start:start + width]
+                return ("…" if start else "") + excerpt + ("…" if start + width < len(doc.text) else "")
+        return doc.text[:width]
+
+
+def slide_text(deck_id, number):
+    """All the text on a slide, tables included."""
+    slide = load_deck(deck_id).SLIDES[number - 1]
+    parts = []
+    for index, block in enumerate(slide.blocks):
+        if isinstance(block, (Markdown, Callout)):
+            parts.append(block.text)
+        elif isinstance(block, Columns):
+            parts.extend(block.texts)
+        elif isinstance(block, Image):
+            parts.append(block.alt)
+        elif isinstance(block, Table):
+            table = load_dataset(block.dataset) if block.dataset else literal_table(deck_id, number, index)
+            parts.append(table.to_string(index=False))
+    return plain_text("\n".join(parts))
+
+
+def documents():
+    """Every searchable document: each slide, the activity and resources sections, then each catalog link."""
+    labels = {module: label for label, module in PAGES.items()}
+    for deck_id in DECKS:
+        for number, slide in enumerate(load_deck(deck_id).SLIDES, start=1):
+            yield Document(labels["views.lecturer_slides"], slide.title, slide_text(deck_id, number),
+                           slide=(deck_id, number))
+    for module, sections in (("views.student_activity", ACTIVITY), ("views.resources", RESOURCES)):
+        for section in sections.values():
+            yield Document(labels[module], section.title, plain_text(section.text), section=section)
+    for resource in get_catalog().resources:
+        # A catalog link opens the first tab it is listed in
+        yield Document(labels["views.resources"], resource.name,
+                       " ".join([resource.description, resource.type, resource.access, resource.era, *resource.tags]),
+                       section=Section(resource.name, resource.description, anchor="resource-catalog",
+                                       tab=resource.sections[0]))
+
+
+def slide_datasets():
+    return sorted({block.dataset for deck_id in DECKS for slide in load_deck(deck_id).SLIDES
+                   for block in slide.blocks if isinstance(block, Table) and block.dataset})
+
+
+@lru_cache(maxsize=2)
+def _index(dataset_tokens):
+    return SearchIndex(documents())
+
+
+def get_index():
+    """Return the shared search index, rebuilt when the catalog or a dataset shown on a slide changes."""
+    return _index(tuple(dataset_token(name) for name in ["resources", *slide_datasets()]))
+
+
+def open_result(doc):
+    """Button callback: switch to the page a result is on and open its slide, tab or expander."""
+    st.session_state.page = doc.page
+    if doc.slide:
+        st.session_state.deck, st.session_state.slide = doc.slide
+    section = doc.section
+    if section is not None:
+        if section.tab:
+            st.session_state[RESOURCES_TABS] = section.tab
+        if section.expander:
+            st.session_state[section.expander] = True
+        if section.anchor:
+            st.session_state.search_anchor = (section.anchor, section.title)
@@ -0,0 +1,48 @@
+"""Process-wide resources and helpers shared by every page.
+
+Kept free of heavy imports so loading it doesn't slow down a cold start.
+"""
+import hmac
+import os
+
+import streamlit as st
+
+from profiling import Profiler
+
+
+@st.cache_resource
+def get_plan_store():
+    """Return the plan store shared by every session in this process."""
+    from storage import PlanStore
+
+    return PlanStore()
+
+
+@st.cache_resource
+def get_draft_store():
+    """Return the autosaved plan drafts shared by every session in this process."""
+    from drafts import DraftStore
+
+    return DraftStore()
+
+
+@st.cache_resource
+def get_profiler():
+    """Return the process-wide rerun profiler."""
+    return Profiler()
+
+
+@st.cache_resource(show_spinner="Preparing the course materials...")
+def warm_up():
+    """Fill every shared cache once per process (classroom deployment mode)."""
+    from deployment import warmup
+
+    warmup()
+    return True
+
+
+def instructor_mode():
+    """Instructor tools show when the URL has ``?instructor=`` set to ``PIONEER_INSTRUCTOR_KEY``."""
+    key = os.environ.get("PIONEER_INSTRUCTOR_KEY")
+    # Compare bytes: compare_digest rejects str with non-ASCII characters
+    return bool(key) and hmac.compare_digest(st.query_params.get("instructor", "").encode(), key.encode())
@@ -0,0 +1,148 @@
+"""Data-driven lecture slides.
+
+Each deck lives in its own module under ``decks/`` and exposes ``TITLE`` and a
+``SLIDES`` tuple built from the blocks below. Decks are imported the first time
+they are shown, and each slide's heavier assets (tables, charts) are built or
+loaded once and cached, with the neighbouring slides prefetched so paging
+through a lecture never waits on them.
+"""
+import html
+import importlib
+from dataclasses import dataclass
+from functools import lru_cache
+
+import streamlit as st
+
+from assets import OFFLINE, local_image
+from datasets import load_dataset
+
+# Deck id → module defining TITLE and SLIDES; add new chapters here
+DECKS = {
+    "chapter9": "decks.chapter9",
+}
+
+
+@dataclass(frozen=True)
+class Markdown:
+    text: str
+    html: bool = False
+
+
+@dataclass(frozen=True)
+class Columns:
+    """Markdown blocks laid out side by side; ``spec`` is passed to ``st.columns``."""
+    texts: tuple
+    spec: object = None
+
+
+@dataclass(frozen=True)
+class Callout:
+    """An ``st.success`` / ``st.info`` / ``st.warning`` box."""
+    kind: str
+    text: str
+
+
+@dataclass(frozen=True)
+class Image:
+    url: str
+    width: int
+    alt: str = ""
+
+
+@dataclass(frozen=True)
+class Table:
+    """A table shown with ``st.dataframe``: a named dataset from ``data/``, or ``(column, values)`` pairs."""
+    dataset: str = None
+    columns: tuple = ()
+
+
+@dataclass(frozen=True)
+class Chart:
+    """A Plotly chart from ``charts.CHARTS``."""
+    name: str
+
+
+@dataclass(frozen=True)
+class Slide:
+    title: str
+    blocks: tuple
+    show_header: bool = True
+
+
+@lru_cache(maxsize=None)
+def load_deck(deck_id):
+    """Import a deck module on first use and return it."""
+    return importlib.import_module(DECKS[deck_id])
+
+
+def slide_table(deck_id, number, index):
+    """Return the DataFrame for block ``index`` of a slide."""
+    block = load_deck(deck_id).SLIDES[number - 1].blocks[index]
+    if block.dataset:
+        return load_dataset(block.dataset)
+    return literal_table(deck_id, number, index)
+
+
+@lru_cache(maxsize=None)
+def literal_table(deck_id, number, index):
+    """Build (once) the DataFrame for a table written out in the deck."""
+    import pandas as pd
+
+    block = load_deck(deck_id).SLIDES[number - 1].blocks[index]
+    return pd.DataFrame(dict(block.columns))
+
+
+def slide_chart(name):
+    """Return the (cached) figure for chart ``name``."""
+    from charts import CHARTS
+
+    return CHARTS[name]()
+
+
+def prefetch(deck_id, number):
+    """Warm the cached assets of the slides either side of ``number``."""
+    slides = load_deck(deck_id).SLIDES
+    for neighbour in (number - 1, number + 1):
+        if 1 <= neighbour <= len(slides):
+            for index, block in enumerate(slides[neighbour - 1].blocks):
+                if isinstance(block, Table):
+                    slide_table(deck_id, neighbour, index)
+                elif isinstance(block, Chart):
+                    slide_chart(block.name)
+
+
+def render_image(block):
+    """Show an image from the local asset cache, falling back to its remote URL when online."""
+    local = local_image(block.url, block.width)
+    if local:
+        src, srcset = local
+        st.markdown(
+            f'<img src="{src}" srcset="{srcset}" width="{block.width}" alt="{html.escape(block.alt)}">',
+            unsafe_allow_html=True
+        )
+    elif not OFFLINE:
+        st.image(block.url, width=block.width)
+    else:
+        st.caption(f"🖼️ {block.alt or 'Image'} (not available offline; run `python assets.py` to vendor it)")
+
+
+def render_slide(deck_id, number):
+    """Render slide ``number`` (1-based) of a deck."""
+    slide = load_deck(deck_id).SLIDES[number - 1]
+    if slide.show_header:
+        st.header(slide.title)
+    for index, block in enumerate(slide.blocks):
+        if isinstance(block, Markdown):
+            st.markdown(block.text, unsafe_allow_html=block.html)
+        elif isinstance(block, Columns):
+            for column, text in zip(st.columns(block.spec or len(block.texts)), block.texts):
+                with column:
+                    st.markdown(text)
+        elif isinstance(block, Callout):
+            getattr(st, block.kind)(block.text)
+        elif isinstance(block, Image):
+            render_image(block)
+        elif isinstance(block, Table):
+            st.dataframe(slide_table(deck_id, number, index), width="stretch", hide_index=True)
+        elif isinstance(block, Chart):
+            st.plotly_chart(slide_chart(block.name), width="stretch")
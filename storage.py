@@ -0,0 +1,189 @@
+"""Durable storage for submitted settlement plans.
+
+Plans are written to a local SQLite database in WAL mode. ``PlanStore.submit``
+only enqueues the plan, so the Streamlit script thread never waits on disk I/O
+or on another session's write; a single background writer thread drains the
+queue and commits plans in batches. The queue is drained before the process
+exits, so a plan that was acknowledged is not lost when the server stops.
+"""
+import atexit
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+from datetime import datetime
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DB_PATH = os.environ.get("PIONEER_DB_PATH", "settlement_plans.db")
+
+PLAN_COLUMNS = [
+    "submitted_at", "term", "section", "student_name", "settlement_name", "region",
+    "latitude", "longitude", "priorities", "challenges", "resources", "vision", "strategy",
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS plans (
+    id INTEGER PRIMARY KEY,
+    submitted_at TEXT NOT NULL,
+    term TEXT NOT NULL,
+    section TEXT NOT NULL DEFAULT '',
+    student_name TEXT NOT NULL,
+    settlement_name TEXT NOT NULL,
+    region TEXT NOT NULL,
+    latitude REAL NOT NULL,
+    longitude REAL NOT NULL,
+    priorities TEXT NOT NULL DEFAULT '[]',
+    challenges TEXT NOT NULL DEFAULT '',
+    resources TEXT NOT NULL DEFAULT '',
+    vision TEXT NOT NULL DEFAULT '',
+    strategy TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS plans_student ON plans (student_name);
+CREATE INDEX IF NOT EXISTS plans_region ON plans (region);
+CREATE INDEX IF NOT EXISTS plans_term_section ON plans (term, section);
+"""
+
+
+def term_for(when):
+    """Return the WCCCD academic term (e.g. ``"Fall 2026"``) containing ``when``."""
+    if when.month <= 4:
+        return f"Winter {when.year}"
+    if when.month <= 7:
+        return f"Spring/Summer {when.year}"
+    return f"Fall {when.year}"
+
+
+# Terms in calendar order within a year, as assigned by term_for
+TERM_SEASONS = ("Winter", "Spring/Summer", "Fall")
+
+
+def term_order(term):
+    """Sort key putting terms named by ``term_for`` in calendar order."""
+    season, _, year = term.rpartition(" ")
+    return int(year), TERM_SEASONS.index(season)
+
+
+def where_clause(**filters):
+    """Build a ``WHERE`` clause matching every filter that is not ``None``."""
+    clauses = [f"{column} = ?" for column, value in filters.items() if value is not None]
+    params = [value for value in filters.values() if value is not None]
+    return ("WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+
+def connect(path):
+    conn = sqlite3.connect(path, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class PlanStore:
+    """Queue-backed SQLite store shared by every session in the process."""
+
+    def __init__(self, path=DB_PATH, batch_size=200):
+        self.path = path
+        self.batch_size = batch_size
+        self._queue = queue.Queue()
+        self._local = threading.local()
+        conn = connect(path)
+        conn.executescript(SCHEMA)
+        conn.close()
+        self._writer = threading.Thread(target=self._write_loop, name="plan-store-writer", daemon=True)
+        self._writer.start()
+        # The writer is a daemon thread; commit what is still queued before the interpreter exits
+        atexit.register(self.flush)
+
+    def submit(self, plan):
+        """Queue ``plan`` for writing and return immediately.
+
+        ``plan`` needs the form fields listed in ``PLAN_COLUMNS``; ``submitted_at``
+        and ``term`` are filled in when missing.
+        """
+        now = datetime.now()
+        record = {"submitted_at": now.isoformat(timespec="seconds"), "term": term_for(now), "section": ""}
+        record.update(plan)
+        record["priorities"] = json.dumps(list(record.get("priorities", [])))
+        self._queue.put(tuple(record.get(column, "") for column in PLAN_COLUMNS))
+
+    def flush(self):
+        """Block until every plan queued so far has been committed."""
+        self._queue.join()
+
+    def _write_loop(self):
+        conn = connect(self.path)
+        insert = f"INSERT INTO plans ({', '.join(PLAN_COLUMNS)}) VALUES ({', '.join('?' * len(PLAN_COLUMNS))})"
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                with conn:
+                    conn.executemany(insert, batch)
+            except sqlite3.Error:
+                # Don't let one bad plan take the rest of the batch down with it
+                for row in batch:
+                    try:
+                        with conn:
+                            conn.execute(insert, row)
+                    except sqlite3.Error:
+                        logger.exception("Could not store settlement plan %r", row)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _reader(self):
+        # Readers get their own connection per thread; WAL lets them run
+        # alongside the writer without taking its lock.
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = connect(self.path)
+        return conn
+
+    def plans(self, student_name=None, region=None, term=None, section=None):
+        """Return stored plans as dicts, optionally filtered by the indexed columns."""
+        where, params = where_clause(student_name=student_name, region=region, term=term, section=section)
+        rows = self._reader().execute(f"SELECT * FROM plans {where} ORDER BY id", params).fetchall()
+        return [dict(row, priorities=json.loads(row["priorities"])) for row in rows]
+
+    def iter_plans(self, batch_size=500, term=None, section=None):
+        """Yield matching plans in lists of at most ``batch_size``, oldest first.
+
+        Plans are paged by id, so only one batch is held in memory at a time.
+        """
+        where, params = where_clause(term=term, section=section)
+        where = f"{where} AND id > ?" if where else "WHERE id > ?"
+        sql = f"SELECT * FROM plans {where} ORDER BY id LIMIT ?"
+        last_id = 0
+        while True:
+            rows = self._reader().execute(sql, [*params, last_id, batch_size]).fetchall()
+            if not rows:
+                return
+            yield [dict(row, priorities=json.loads(row["priorities"])) for row in rows]
+            last_id = rows[-1]["id"]
+
+    def coordinates_since(self, last_id, term=None, section=None):
+        """Return ``(ids, latitudes, longitudes)`` arrays for plans with ``id > last_id``."""
+        where, params = where_clause(term=term, section=section)
+        where = f"{where} AND id > ?" if where else "WHERE id > ?"
+        rows = self._reader().execute(
+            f"SELECT id, latitude, longitude FROM plans {where} ORDER BY id", [*params, last_id]
+        ).fetchall()
+        columns = np.array(rows, dtype=float).reshape(-1, 3)
+        return columns[:, 0].astype(np.int64), columns[:, 1], columns[:, 2]
+
+    def terms_and_sections(self):
+        """Return the distinct ``(term, section)`` pairs that have plans."""
+        rows = self._reader().execute("SELECT DISTINCT term, section FROM plans ORDER BY term, section")
+        return [tuple(row) for row in rows]
+
+    def count(self):
+        return self._reader().execute("SELECT COUNT(*) FROM plans").fetchone()[0]
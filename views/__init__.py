@@ -0,0 +1,18 @@
+"""App pages, imported the first time they are visited.
+
+Each module exposes ``render(run)``, where ``run`` is the current
+``profiling.RunProfile``. Keeping pages in separate modules means a visit to
+one page never imports another page's heavy dependencies (pandas, plotly).
+"""
+import importlib
+
+# Sidebar label → page module
+PAGES = {
+    "🎓 Lecturer Slides": "views.lecturer_slides",
+    "🗺️ Student Activity": "views.student_activity",
+    "📖 Resources & Library": "views.resources",
+}
+
+
+def load_page(label):
+    return importlib.import_module(PAGES[label])
@@ -0,0 +1,68 @@
+"""Lecturer Slides page."""
+import streamlit as st
+
+from slides import DECKS, load_deck, prefetch, render_slide
+
+
+def init_slide(slide_count):
+    """Start on the ``?slide=N`` deep link (if any) the first time the slides are shown."""
+    if "slide" not in st.session_state:
+        try:
+            slide = int(st.query_params.get("slide", 1))
+        except ValueError:
+            slide = 1
+        st.session_state.slide = slide
+    st.session_state.slide = min(max(st.session_state.slide, 1), slide_count)
+
+
+def mark_navigation():
+    """Remember which run a navigation happened on, to count the reruns it costs."""
+    st.session_state.navigation_run = st.session_state.run_count
+
+
+def step_slide(step, slide_count):
+    # Runs as a button callback, i.e. before the rerun, so one click is one rerun
+    st.session_state.slide = min(max(st.session_state.slide + step, 1), slide_count)
+    mark_navigation()
+
+
+def render(run):
+    # Decks are imported on first use; only offer a choice once there is more than one
+    deck_id = next(iter(DECKS))
+    if len(DECKS) > 1:
+        deck_id = st.selectbox("Chapter:", list(DECKS), format_func=lambda d: load_deck(d).TITLE, key="deck")
+    deck = load_deck(deck_id)
+    slide_count = len(deck.SLIDES)
+    
+    st.title(f"🎓 Lecturer Presentation: {deck.TITLE}")
+    
+    # Slide selector (session state, the slider, the buttons and ?slide=N all stay in sync)
+    init_slide(slide_count)
+    slide_num = st.select_slider(
+        "Select Slide:",
+        options=list(range(1, slide_count + 1)),
+        format_func=lambda x: f"Slide {x}",
+        key="slide",
+        on_change=mark_navigation
+    )
+    if st.query_params.get("slide") != str(slide_num):
+        st.query_params["slide"] = str(slide_num)
+    
+    st.markdown("---")
+    
+    with run.section(f"slide {slide_num}"):
+        render_slide(deck_id, slide_num)
+    prefetch(deck_id, slide_num)
+    
+    # Navigation buttons (PageUp/PageDown also work with presentation clickers)
+    st.markdown("---")
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        st.button("⬅️ Previous Slide", disabled=(slide_num == 1), shortcut="PageUp",
+                  on_click=step_slide, args=(-1, slide_count))
+    with col3:
+        st.button("Next Slide ➡️", disabled=(slide_num == slide_count), shortcut="PageDown",
+                  on_click=step_slide, args=(1, slide_count))
+    
+    if "navigation_run" in st.session_state and st.query_params.get("debug"):
+        st.caption(f"🔁 Reruns for the last navigation: {st.session_state.run_count - st.session_state.navigation_run}")
@@ -0,0 +1,107 @@
+"""Resources & Library page."""
+import streamlit as st
+
+from catalog import FACETS, get_catalog
+from content import RESOURCES, RESOURCES_TABS
+from linkcheck import LINK_HEALTH_PATH, check_running, dead_links, health_report, load_health, start_background_check
+from shared import instructor_mode
+
+
+def render(run):
+    st.title("📖 Resources & Library Research")
+    st.markdown("### Explore More About Michigan History")
+
+    # WCCCD Library Section
+    st.header("🎓 Wayne County Community College District Library", anchor="wcccd-library")
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.markdown(RESOURCES["library_services"].text)
+
+    with col2:
+        st.info(RESOURCES["library_hours"].text)
+
+    st.markdown("---")
+
+    # Library and online resources, rendered from the catalog in data/resources.csv
+    st.header("🔗 Library & Online Resources", anchor="resource-catalog")
+
+    catalog = get_catalog()
+    selected = {}
+    for column, (facet, label) in zip(st.columns(len(FACETS)), FACETS.items()):
+        with column:
+            selected[facet] = st.pills(label, catalog.values(facet), selection_mode="multi", key=f"catalog_{facet}")
+    ids = catalog.match(**selected)
+    st.caption(f"Showing {len(ids)} of {len(catalog.resources)} resources")
+
+    # Links found dead by the last out-of-band check (python linkcheck.py); the page never checks them itself
+    dead = dead_links()
+
+    # The tabs are keyed so search results can open them. They track which one is selected, so only
+    # that tab's list is rendered and sent; the lists themselves are cached per filter selection
+    sections = catalog.values("section")
+    tabs = st.tabs(sections, key=RESOURCES_TABS, on_change="rerun")
+
+    for tab, section in zip(tabs, sections):
+        if not tab.open:
+            continue
+        with tab:
+            listing = catalog.section_markdown(section, ids, dead)
+            if listing:
+                st.markdown(listing)
+            else:
+                st.caption("No resources in this section match the filters.")
+
+    st.markdown("---")
+
+    # Recommended Books Section
+    st.header("📚 Recommended Reading", anchor="recommended-reading")
+
+    st.markdown(RESOURCES["primary_text"].text)
+
+    for column, key in zip(st.columns(2), ["books_general", "books_topics"]):
+        with column:
+            st.markdown(RESOURCES[key].text)
+
+    st.markdown("---")
+
+    # Research Tips
+    st.header("💡 Research Tips for Students", anchor="research-tips")
+
+    for column, key in zip(st.columns(2), ["research_steps", "evaluating"]):
+        with column:
+            st.markdown(RESOURCES[key].text)
+
+    st.markdown("---")
+
+    # Assignment Ideas
+    st.header("✍️ Research Project Ideas", anchor="research-projects")
+
+    # Rendered only once opened
+    projects = st.expander("Click for research project suggestions", key="projects_expander", on_change="rerun")
+    if projects.open:
+        with projects:
+            st.markdown(RESOURCES["projects"].text)
+
+    # Contact Information
+    st.markdown("---")
+    st.info(RESOURCES["help"].text)
+
+    # Instructor link health report
+    if instructor_mode():
+        st.markdown("---")
+        st.subheader("🧑‍🏫 Instructor: Link Health")
+
+        report = health_report(catalog.resources, load_health())
+        states = {}
+        for row in report:
+            states[row["state"]] = states.get(row["state"], 0) + 1
+        st.caption(", ".join(f"{count} {state}" for state, count in states.items())
+                   + f" (results from `{LINK_HEALTH_PATH}`)")
+        if check_running():
+            st.info("A link check is running; reload the page in a minute for its results.")
+        elif st.button("🔄 Check links now"):
+            start_background_check()
+            st.info("Link check started in the background; reload the page in a minute for its results.")
+        st.dataframe(report, width="stretch", hide_index=True)
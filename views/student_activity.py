@@ -0,0 +1,419 @@
+"""Student Activity page: the 1825 map and the settlement plan form."""
+import time
+from contextlib import contextmanager
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from content import ACTIVITY
+from datasets import dataset_token
+from deployment import CLASSROOM, FigurePool
+from drafts import FLUSH_INTERVAL
+from export import EXPORTERS, export_plans
+from heatmap import ClassHeatmap
+from michigan_map import (MAP_DATA_VERSION, build_base_map, build_timeline_map, move_preview_pin, set_class_heatmap,
+                          with_overlays)
+from regions import REGION_NAMES, consistency_report, region_at
+from reports import (FORMATS as REPORT_FORMATS, PDF_CHARSET_NOTE, PRIORITY_OPTIONS, plan_priorities,
+                     render as render_report)
+from scoring import CRITERIA, score_plan
+from shared import get_draft_store, get_plan_store, get_profiler, instructor_mode
+from storage import term_order
+
+
+@st.cache_resource(max_entries=2)
+def load_base_map(data_version, places_token):
+    """Return the shared base map; a new ``data_version`` or places file invalidates the cache."""
+    return build_base_map()
+
+
+@st.cache_resource(max_entries=2)
+def load_timeline_map(data_version, dataset_tokens):
+    """Return the shared 1815-1840 history map, rebuilt when its data changes."""
+    return build_timeline_map()
+
+
+@st.cache_resource(max_entries=2)
+def get_map_pool(data_version, places_token):
+    """Return the shared map figures sessions borrow in classroom mode."""
+    return FigurePool(lambda: with_overlays(load_base_map(data_version, places_token)))
+
+
+def timeline_tokens():
+    return tuple(dataset_token(name) for name in ("places", "regional_settlement", "population_timeline"))
+
+
+def warm_maps():
+    """Build the shared maps ahead of the first visit (classroom mode warmup)."""
+    places_token = dataset_token("places")
+    load_base_map(MAP_DATA_VERSION, places_token)
+    load_timeline_map(MAP_DATA_VERSION, timeline_tokens())
+    if CLASSROOM:
+        get_map_pool(MAP_DATA_VERSION, places_token)
+
+
+@st.cache_resource
+def get_class_heatmap():
+    """Return the incrementally updated class settlement grids."""
+    return ClassHeatmap(get_plan_store())
+
+
+# Widget keys of the plan fields that are autosaved as a draft
+DRAFT_KEYS = [
+    "student_name", "settlement_name", "region", "latitude", "longitude",
+    *[key for key, _, _ in PRIORITY_OPTIONS],
+    "challenges", "resources", "vision", "strategy",
+]
+
+REGIONS = ["Select a region...", *REGION_NAMES]
+
+
+def stage_draft(key):
+    """Widget callback: buffer an edited field until the next draft flush."""
+    st.session_state.setdefault("draft_buffer", {})[key] = st.session_state[key]
+
+
+def use_region(region):
+    """Button callback: switch the region selectbox to where the pin actually is."""
+    st.session_state.region = region
+    stage_draft("region")
+
+
+def restore_draft():
+    """Refill plan widgets that Streamlit dropped while another page was shown."""
+    missing = [key for key in DRAFT_KEYS if key not in st.session_state]
+    if not missing:
+        return
+    draft = get_draft_store().restore(get_script_run_ctx().session_id)
+    draft.update(st.session_state.get("draft_buffer", {}))
+    for key in missing:
+        if key in draft:
+            st.session_state[key] = draft[key]
+    st.session_state.setdefault("latitude", 42.5)
+    st.session_state.setdefault("longitude", -84.5)
+
+
+def flush_draft():
+    """Write buffered edits to the draft store, at most once per ``FLUSH_INTERVAL``."""
+    buffer = st.session_state.get("draft_buffer")
+    now = time.monotonic()
+    if buffer and now - st.session_state.get("draft_flushed", 0) >= FLUSH_INTERVAL:
+        get_draft_store().save(get_script_run_ctx().session_id, buffer)
+        buffer.clear()
+        st.session_state.draft_flushed = now
+
+
+def in_fragment_rerun():
+    """Whether this run reruns only a fragment rather than the whole page."""
+    return bool(get_script_run_ctx().fragment_ids_this_run)
+
+
+@contextmanager
+def profile_fragment(run, name):
+    """Profile a fragment: as a section of the page's run, or as a run of its own when it reruns alone."""
+    if not in_fragment_rerun():
+        with run.section(name):
+            yield run
+        return
+    own = get_profiler().start_run(get_script_run_ctx().session_id, f"{run.page} › {name}")
+    try:
+        with own.section(name):
+            yield own
+    finally:
+        own.finish()
+
+
+@st.fragment
+def map_panel(run):
+    """The map column: reruns on its own when a slider, toggle or heatmap filter changes."""
+    with profile_fragment(run, "map panel") as run:
+        st.subheader("🗺️ Michigan Territory Map (1825)")
+        
+        # Reserve the map's spot so the sliders below can feed the preview pin
+        map_slot = st.empty()
+        
+        # Location selection (outside the form so the preview pin follows the sliders)
+        latitude = st.slider("Latitude (approximate):", 41.7, 46.0, step=0.1, key="latitude",
+                             on_change=stage_draft, args=("latitude",))
+        longitude = st.slider("Longitude (approximate):", -87.0, -82.5, step=0.1, key="longitude",
+                              on_change=stage_draft, args=("longitude",))
+        
+        # The plan panel's region check only changes when the pin enters another region
+        if in_fragment_rerun() and region_at(latitude, longitude) != st.session_state.get("plan_located"):
+            st.rerun()
+        
+        # Lecturer view: where the whole class chose to settle
+        class_grid = None
+        if instructor_mode() and st.toggle("Show where the class settled", key="show_class_heatmap"):
+            groups = get_plan_store().terms_and_sections()
+            terms = sorted({term for term, _ in groups}, key=term_order, reverse=True)
+            sections = sorted({section for _, section in groups if section})
+            col_term, col_section = st.columns(2)
+            with col_term:
+                term = st.selectbox("Term:", ["All terms"] + terms, key="heatmap_term")
+            with col_section:
+                section = st.selectbox("Section:", ["All sections"] + sections, key="heatmap_section")
+            class_grid = get_class_heatmap().grid(
+                term=None if term == "All terms" else term,
+                section=None if section == "All sections" else section,
+            )
+            st.caption(f"🔥 {class_grid.total} settlement plans shown on the map")
+        
+        # History mode: the year slider and animation run in the browser, not as reruns
+        if st.toggle("🕰️ Show history 1815–1840", key="map_timeline"):
+            with run.section("history map"):
+                fig = load_timeline_map(MAP_DATA_VERSION, timeline_tokens())
+                map_slot.plotly_chart(fig, width="stretch")
+            run.payload("history map", fig)
+        elif CLASSROOM:
+            # Borrow a shared map just long enough to patch the overlays and send it
+            with run.section("activity map"), get_map_pool(MAP_DATA_VERSION, dataset_token("places")).borrow() as fig:
+                set_class_heatmap(fig, class_grid)
+                move_preview_pin(fig, latitude, longitude)
+                map_slot.plotly_chart(fig, width="stretch")
+                run.payload("activity map", fig)
+        else:
+            # Each session copies the shared base map once, then only the overlays are patched
+            with run.section("activity map"):
+                places_token = dataset_token("places")
+                map_key = f"session_map_v{MAP_DATA_VERSION}"
+                if st.session_state.get(f"{map_key}_places") != places_token:
+                    st.session_state[map_key] = with_overlays(load_base_map(MAP_DATA_VERSION, places_token))
+                    st.session_state[f"{map_key}_places"] = places_token
+                fig = set_class_heatmap(st.session_state[map_key], class_grid)
+                fig = move_preview_pin(fig, latitude, longitude)
+                
+                map_slot.plotly_chart(fig, width="stretch")
+            run.payload("activity map", fig)
+        
+        st.info("💡 **Tip:** Hover over different areas to learn about them. Click on legend items to show/hide layers. Use the sliders to move the orange preview pin.")
+
+        # Autosave: buffered edits reach the draft store at most every few seconds
+        flush_draft()
+
+
+@st.fragment
+def plan_panel(run):
+    """The plan form column: reruns on its own when a field is edited or the plan is submitted."""
+    with profile_fragment(run, "plan panel") as run:
+        st.subheader("🎯 Your Settlement Plan")
+        
+        # Student input form (plain widgets rather than st.form, so edits can be autosaved)
+        with st.container(border=True):
+            st.markdown("**As a pioneer explorer in 1825, plan your settlement:**")
+            
+            student_name = st.text_input("Your Name:", placeholder="Enter your name", key="student_name",
+                                         on_change=stage_draft, args=("student_name",))
+            
+            settlement_name = st.text_input("Settlement Name:", placeholder="e.g., New Plymouth", key="settlement_name",
+                                            on_change=stage_draft, args=("settlement_name",))
+            
+            region = st.selectbox("Choose Your Region:", REGIONS, key="region",
+                                  on_change=stage_draft, args=("region",))
+            
+            # The region the pin is actually in, from the precomputed region grid; the map panel
+            # reruns the whole page when the pin crosses into another region, so this stays current
+            latitude, longitude = st.session_state.latitude, st.session_state.longitude
+            located = st.session_state.plan_located = region_at(latitude, longitude)
+            st.caption(f"📍 Your map pin is in the {located} region." if located
+                       else "📍 Your map pin is outside the listed regions.")
+            if located and region not in (REGIONS[0], located):
+                st.warning(f"⚠️ Your pin is in the {located} region, not {region}.")
+                st.button(f"Use {located}", on_click=use_region, args=(located,))
+            
+            st.markdown("---")
+            st.markdown("**Why this location?**")
+            
+            # Factors considered
+            st.markdown("**Select your top 3 priorities:**")
+            col_a, col_b = st.columns(2)
+            
+            priority_checks = {}
+            for i, (key, label, _) in enumerate(PRIORITY_OPTIONS):
+                with col_a if i < len(PRIORITY_OPTIONS) / 2 else col_b:
+                    priority_checks[key] = st.checkbox(label, key=key, on_change=stage_draft, args=(key,))
+            
+            st.markdown("---")
+            
+            # Challenges
+            challenges = st.text_area(
+                "What challenges do you expect?",
+                placeholder="Describe the obstacles you'll face (forest clearing, swamps, isolation, etc.)",
+                height=100, key="challenges", on_change=stage_draft, args=("challenges",)
+            )
+            
+            # Resources
+            resources = st.text_area(
+                "What resources are available?",
+                placeholder="List the natural resources and advantages of your location",
+                height=100, key="resources", on_change=stage_draft, args=("resources",)
+            )
+            
+            # Vision
+            vision = st.text_area(
+                "What will your settlement become in 20 years?",
+                placeholder="Describe your community's future (farming hub, trading post, mill town, etc.)",
+                height=100, key="vision", on_change=stage_draft, args=("vision",)
+            )
+            
+            # First year strategy
+            strategy = st.text_area(
+                "Your first year survival strategy:",
+                placeholder="What are your priorities? (shelter, clearing land, crops, relationships, etc.)",
+                height=100, key="strategy", on_change=stage_draft, args=("strategy",)
+            )
+            
+            submitted = st.button("📝 Submit Your Settlement Plan", width="stretch")
+        
+        # The summary and download buttons live outside the bordered form area
+        if submitted:
+            if student_name and settlement_name and region != "Select a region...":
+                plan = {
+                    "section": st.query_params.get("section", ""),
+                    "student_name": student_name,
+                    "settlement_name": settlement_name,
+                    "region": region,
+                    "latitude": latitude,
+                    "longitude": longitude,
+                    "priorities": plan_priorities(priority_checks),
+                    "challenges": challenges,
+                    "resources": resources,
+                    "vision": vision,
+                    "strategy": strategy,
+                }
+                
+                # Save the plan (the store writes it in the background); its draft is no longer needed
+                get_plan_store().submit(plan)
+                st.session_state.pop("draft_buffer", None)
+                get_draft_store().discard(get_script_run_ctx().session_id)
+                
+                st.success(f"✅ Settlement plan submitted for {settlement_name}!")
+                
+                # Display summary
+                st.markdown("### 📋 Your Plan Summary")
+                st.markdown(render_report(plan, "markdown"))
+                
+                # How the site compares with the 1825 geography
+                score = score_plan(plan)
+                st.markdown("### 🧭 Site Assessment")
+                st.metric("Site score", f"{score['total']:.0f} / 100")
+                st.caption(" · ".join(
+                    f"{name.title()}: {score[f'{name}_points']:.0f}/{weight}" for name, (weight, _, _) in CRITERIA.items()
+                ))
+                if not score["on_map"]:
+                    st.info("📍 This site is out on the lakes, not on Michigan land.")
+                if score["unmet_priorities"]:
+                    st.warning("⚠️ Your site does little for these priorities: " + ", ".join(score["unmet_priorities"]))
+                
+                # Option to download (files are rendered only when a button is clicked)
+                file_stem = f"settlement_plan_{settlement_name.replace(' ', '_')}"
+                for column, fmt in zip(st.columns(3), ["text", "html", "pdf"]):
+                    extension, mime = REPORT_FORMATS[fmt]
+                    with column:
+                        st.download_button(
+                            label=f"📄 Download ({extension.upper()}{', Latin script only' if fmt == 'pdf' else ''})",
+                            data=lambda fmt=fmt: render_report(plan, fmt),
+                            help=PDF_CHARSET_NOTE if fmt == "pdf" else None,
+                            file_name=f"{file_stem}.{extension}",
+                            mime=mime,
+                            on_click="ignore",
+                            width="stretch"
+                        )
+            else:
+                st.error("⚠️ Please fill in your name, settlement name, and choose a region!")
+
+        # Autosave: buffered edits reach the draft store at most every few seconds
+        flush_draft()
+
+
+def render(run):
+    restore_draft()
+    
+    st.title("🏕️ Michigan Pioneer Settlement Challenge")
+    st.markdown("### Chapter 9: The Error of the Pioneers")
+
+    # Historical context. The expanders track their state, so a collapsed one is sent empty and
+    # its text is only rendered once a student opens it
+    background = st.expander("📖 Historical Background - Click to Read", key="background_expander", on_change="rerun")
+    if background.open:
+        with background:
+            st.markdown(ACTIVITY["background"].text)
+
+    # The map and the plan form rerun independently: moving a slider only redraws the map and
+    # editing the plan only redraws the form (see map_panel and plan_panel)
+    col1, col2 = st.columns([1.5, 1])
+    with col1:
+        map_panel(run)
+    with col2:
+        plan_panel(run)
+
+    # Discussion questions section
+    st.markdown("---")
+    st.subheader("💭 Class Discussion Questions", anchor="discussion-questions")
+
+    discussion = st.expander("Click to view discussion questions", key="discussion_expander", on_change="rerun")
+    if discussion.open:
+        with discussion:
+            st.markdown(ACTIVITY["discussion"].text)
+
+    # Historical outcome section
+    st.markdown("---")
+    st.subheader("📚 What Actually Happened?", anchor="historical-outcome")
+
+    outcome = st.expander("Click to see the historical outcome", key="outcome_expander", on_change="rerun")
+    if outcome.open:
+        with outcome:
+            st.markdown(ACTIVITY["outcome"].text)
+
+    # Instructor bulk export
+    if instructor_mode():
+        st.markdown("---")
+        st.subheader("🧑‍🏫 Instructor: Export Class Plans")
+        
+        groups = get_plan_store().terms_and_sections()
+        terms = sorted({term for term, _ in groups}, key=term_order, reverse=True)
+        # A keyed selectbox keeps a stale choice (or None) after the options change
+        if st.session_state.get("export_term") not in terms:
+            st.session_state.pop("export_term", None)
+            st.session_state.pop("export_section", None)
+        col_term, col_section = st.columns(2)
+        with col_term:
+            export_term = st.selectbox("Term:", terms, key="export_term")
+        sections = sorted({section for term, section in groups if term == export_term})
+        if "export_section" in st.session_state and st.session_state.export_section not in sections:
+            del st.session_state.export_section
+        with col_section:
+            export_section = st.selectbox(
+                "Section:",
+                sections,
+                format_func=lambda section: section or "(no section)",
+                key="export_section"
+            )
+        
+        if export_term is None:
+            st.info("No settlement plans have been submitted yet.")
+        else:
+            # Files are generated only when a button is clicked, outside the page script
+            export_name = f"settlement_plans_{export_term}_{export_section or 'no-section'}".replace(" ", "_").replace("/", "-")
+            labels = {"csv": "📊 Grades (CSV)", "parquet": "🗃️ Grades (Parquet)", "zip": "🗂️ All Reports (ZIP)"}
+            for column, (fmt, (_, mime)) in zip(st.columns(len(EXPORTERS)), EXPORTERS.items()):
+                with column:
+                    st.download_button(
+                        label=labels[fmt],
+                        data=lambda fmt=fmt: export_plans(get_plan_store(), fmt, term=export_term, section=export_section),
+                        file_name=f"{export_name}.{fmt}",
+                        mime=mime,
+                        on_click="ignore",
+                        width="stretch"
+                    )
+            
+            # Plans whose pin sits outside the region the student chose; the plans are only scanned
+            # while the expander is open
+            consistency = st.expander("🧭 Region consistency", key="consistency_expander", on_change="rerun")
+            if consistency.open:
+                with consistency:
+                    checked, mismatches = consistency_report(get_plan_store(), term=export_term,
+                                                             section=export_section)
+                    st.caption(f"{len(mismatches)} of {checked} plans have their pin outside the region they chose.")
+                    if mismatches:
+                        st.dataframe(mismatches, width="stretch", hide_index=True)